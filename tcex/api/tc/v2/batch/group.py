@@ -1,9 +1,16 @@
 """ThreatConnect Batch Import Module"""
 # standard library
 import json
-import uuid
+import os
+from datetime import datetime
 from typing import Any, Callable, Optional, Union
 
+try:
+    # third-party
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # orjson is an optional faster JSON encoder
+
 # first-party
 from tcex.api.tc.v2.batch.attribute import Attribute
 from tcex.api.tc.v2.batch.security_label import SecurityLabel
@@ -16,20 +23,40 @@ class Group:
 
     __slots__ = [
         '_attributes',
+        '_attributes_by_type',
+        '_dirty',
         '_file_content',
         '_group_data',
         '_labels',
-        '_name',
+        '_labels_by_name',
         '_processed',
-        '_type',
         '_tags',
+        '_tags_by_name',
         'file_content',
         'malware',
         'password',
         'status',
-        'utils',
     ]
 
+    # Utils is stateless, so a single instance is shared by all Group objects
+    utils = Utils()
+
+    # the datetime fields that are converted to ISO 8601 format
+    _date_keys = frozenset(['dateAdded', 'eventDate', 'firstSeen', 'publishDate'])
+
+    # metadata map for Group objects (kwarg name -> batch schema name)
+    _metadata_map = {
+        'date_added': 'dateAdded',
+        'event_date': 'eventDate',
+        'file_name': 'fileName',
+        'file_text': 'fileText',
+        'file_type': 'fileType',
+        'first_seen': 'firstSeen',
+        'from_addr': 'from',
+        'publish_date': 'publishDate',
+        'to_addr': 'to',
+    }
+
     def __init__(self, group_type: str, name: str, **kwargs):
         """Initialize Class Properties.
 
@@ -38,39 +65,52 @@ class Group:
             name (str): The name for this Group.
             xid (str, kwargs): The external id for this Group.
         """
-        self._name = name
         self._group_data = {'name': name, 'type': group_type}
-        self._type = group_type
 
         # properties
         self._attributes = []
+        self._attributes_by_type = {}  # attr_type -> list of attributes (for dedupe)
+        self._dirty = False  # True when attributes, labels, or tags need to be added to data
         self._labels = []
+        self._labels_by_name = {}  # name -> security label (for dedupe)
         self._file_content = None
         self._tags = []
+        self._tags_by_name = {}  # name -> tag (for dedupe)
         self._processed = False
-        self.utils = Utils()
 
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
             self.add_key_value(arg, value)
         # set xid to random and unique uuid4 value if not provided
         if kwargs.get('xid') is None:
-            self._group_data['xid'] = str(uuid.uuid4())
+            self._group_data['xid'] = self._generate_xid()
 
-    @property
-    def _metadata_map(self) -> dict:
-        """Return metadata map for Group objects."""
-        return {
-            'date_added': 'dateAdded',
-            'event_date': 'eventDate',
-            'file_name': 'fileName',
-            'file_text': 'fileText',
-            'file_type': 'fileType',
-            'first_seen': 'firstSeen',
-            'from_addr': 'from',
-            'publish_date': 'publishDate',
-            'to_addr': 'to',
-        }
+    @staticmethod
+    def _generate_xid() -> str:
+        """Return a random uuid4 string (e.g., 1b4e28ba-2fa1-41d2-883f-0016d3cca427).
+
+        The uuid4 is built from os.urandom directly, which skips creating the UUID object.
+        The value has the same format as str(uuid.uuid4()).
+        """
+        data = bytearray(os.urandom(16))
+        data[6] = data[6] & 0x0F | 0x40  # version 4
+        data[8] = data[8] & 0x3F | 0x80  # RFC 4122 variant
+        hex_ = data.hex()
+        return f'{hex_[:8]}-{hex_[8:12]}-{hex_[12:16]}-{hex_[16:20]}-{hex_[20:]}'
+
+    def _format_datetime(self, value: Any) -> str:
+        """Return the datetime expression formatted for batch (e.g., 2021-01-01T00:00:00Z).
+
+        Args:
+            value: The datetime expression to format.
+        """
+        if isinstance(value, str) and len(value) == 20:
+            try:
+                # fast path for values that are already in the batch datetime format
+                return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%dT%H:%M:%SZ')
+            except ValueError:
+                pass
+        return self.utils.any_to_datetime(value).strftime('%Y-%m-%dT%H:%M:%SZ')
 
     def add_file(self, filename: str, file_content: Union[bytes, Callable[[str], Any], str]):
         """Add a file for Document and Report types.
@@ -102,11 +142,9 @@ class Group:
             value: The field value to add to the JSON batch data.
         """
         key = self._metadata_map.get(key, key)
-        if key in ['dateAdded', 'eventDate', 'firstSeen', 'publishDate']:
+        if key in self._date_keys:
             if value is not None:
-                self._group_data[key] = self.utils.any_to_datetime(value).strftime(
-                    '%Y-%m-%dT%H:%M:%SZ'
-                )
+                self._group_data[key] = self._format_datetime(value)
         elif key == 'file_content':
             # file content arg is not part of Group JSON
             pass
@@ -149,44 +187,45 @@ class Group:
         Returns:
             Attribute: An instance of the Attribute class.
         """
-        attr = Attribute(attr_type, attr_value, displayed, source, formatter)
+        # format the value before the unique check so duplicates do not create an Attribute
+        if formatter is not None:
+            attr_value = formatter(attr_value)
+
+        attributes_of_type = self._attributes_by_type.setdefault(attr_type, [])
+        if unique is True:
+            for attribute_data in attributes_of_type:
+                if attribute_data.value == attr_value:
+                    return attribute_data
+
+        attr = Attribute(attr_type, attr_value, displayed, source)
         if unique == 'Type':
-            for attribute_data in self._attributes:
-                if attribute_data.type == attr_type:
-                    self._attributes.remove(attribute_data)
-                    break
+            if attributes_of_type:
+                self._attributes.remove(attributes_of_type.pop(0))
+            attributes_of_type.append(attr)
             self._attributes.append(attr)
-        elif unique is True:
-            for attribute_data in self._attributes:
-                if attribute_data.type == attr_type and attribute_data.value == attr.value:
-                    attr = attribute_data
-                    break
-            else:
-                self._attributes.append(attr)
-        elif unique is False:
+        elif unique is False or unique is True:
+            attributes_of_type.append(attr)
             self._attributes.append(attr)
+        self._dirty = True
         return attr
 
     @property
     def data(self) -> dict:
         """Return Group data."""
+        if not self._dirty:
+            # attributes, labels, and tags have not changed since the last build
+            return self._group_data
+
         # add attributes
         if self._attributes:
-            self._group_data['attribute'] = []
-            for attr in self._attributes:
-                if attr.valid:
-                    self._group_data['attribute'].append(attr.data)
+            self._group_data['attribute'] = [attr.data for attr in self._attributes if attr.valid]
         # add security labels
         if self._labels:
-            self._group_data['securityLabel'] = []
-            for label in self._labels:
-                self._group_data['securityLabel'].append(label.data)
+            self._group_data['securityLabel'] = [label.data for label in self._labels]
         # add tags
         if self._tags:
-            self._group_data['tag'] = []
-            for tag in self._tags:
-                if tag.valid:
-                    self._group_data['tag'].append(tag.data)
+            self._group_data['tag'] = [tag.data for tag in self._tags if tag.valid]
+        self._dirty = False
         return self._group_data
 
     @property
@@ -197,9 +236,7 @@ class Group:
     @date_added.setter
     def date_added(self, date_added: str):
         """Set Indicator dateAdded."""
-        self._group_data['dateAdded'] = self.utils.any_to_datetime(date_added).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
-        )
+        self._group_data['dateAdded'] = self._format_datetime(date_added)
 
     @property
     def file_data(self) -> dict:
@@ -244,13 +281,12 @@ class Group:
         Returns:
             SecurityLabel: An instance of the SecurityLabel class.
         """
-        label = SecurityLabel(name, description, color)
-        for label_data in self._labels:
-            if label_data.name == name:
-                label = label_data
-                break
-        else:
+        label = self._labels_by_name.get(name)
+        if label is None:
+            label = SecurityLabel(name, description, color)
+            self._labels_by_name[name] = label
             self._labels.append(label)
+            self._dirty = True
         return label
 
     def tag(self, name: str, formatter: Optional[Callable[[str], str]] = None) -> 'Tag':
@@ -263,13 +299,12 @@ class Group:
         Returns:
             Tag: An instance of the Tag class.
         """
-        tag = Tag(name, formatter)
-        for tag_data in self._tags:
-            if tag_data.name == name:
-                tag = tag_data
-                break
-        else:
+        tag = self._tags_by_name.get(name)
+        if tag is None:
+            tag = Tag(name, formatter)
+            self._tags_by_name.setdefault(tag.name, tag)
             self._tags.append(tag)
+            self._dirty = True
         return tag
 
     @property
@@ -282,9 +317,44 @@ class Group:
         """Return Group xid."""
         return self._group_data.get('xid')
 
+    @staticmethod
+    def _has_float(data: dict) -> bool:
+        """Return True if the data has a float value."""
+        values = [data]
+        while values:
+            value = values.pop()
+            type_ = type(value)
+            if type_ is float:
+                return True
+            if type_ is dict:
+                values.extend(value.values())
+            elif type_ is list:
+                values.extend(value)
+        return False
+
     def __str__(self) -> str:
-        """Return string representation of object."""
-        return json.dumps(self.data, indent=4)
+        """Return string representation of object.
+
+        When orjson is installed it is used and the output is indented with 4 spaces, so the
+        string is the same as json.dumps(indent=4). The json module is used for data that the
+        two libraries format differently (non-ASCII characters and float values).
+        """
+        data = self.data
+        if orjson is not None and not self._has_float(data):
+            try:
+                value = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            except TypeError:
+                # orjson does not support some values (e.g., int larger than 64 bits)
+                value = None
+
+            if value is not None and value.isascii():
+                # orjson indents 2 spaces per level, replace each level with 4 spaces (JSON
+                # strings can not contain a raw newline or null character)
+                value = value.replace('\n  ', '\n\x00')
+                while '\x00  ' in value:
+                    value = value.replace('\x00  ', '\x00\x00')
+                return value.replace('\x00', '    ')
+        return json.dumps(data, indent=4)
 
 
 class Adversary(Group):
@@ -343,9 +413,7 @@ class Campaign(Group):
     @first_seen.setter
     def first_seen(self, first_seen: str):
         """Set Document first seen."""
-        self._group_data['firstSeen'] = self.utils.any_to_datetime(first_seen).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
-        )
+        self._group_data['firstSeen'] = self._format_datetime(first_seen)
 
 
 class CourseOfAction(Group):
@@ -367,7 +435,7 @@ class CourseOfAction(Group):
 class Document(Group):
     """ThreatConnect Batch Document Object"""
 
-    __slots__ = ['_file_data']
+    __slots__ = []
 
     def __init__(self, name: str, file_name: str, **kwargs):
         """Initialize Class Properties.
@@ -387,15 +455,6 @@ class Document(Group):
         # file data/content to upload
         self._file_content = kwargs.get('file_content')
 
-    @property
-    def file_data(self) -> dict:
-        """Return Group files."""
-        return {
-            'fileContent': self._file_content,
-            'fileName': self._group_data.get('fileName'),
-            'type': self._group_data.get('type'),
-        }
-
     @property
     def malware(self) -> bool:
         """Return Document malware."""
@@ -443,8 +502,8 @@ class Email(Group):
 
     @property
     def from_addr(self) -> str:
-        """Return Email to."""
-        return self._group_data.get('to')
+        """Return Email from."""
+        return self._group_data.get('from')
 
     @from_addr.setter
     def from_addr(self, from_addr: str):
@@ -498,14 +557,12 @@ class Event(Group):
     @property
     def event_date(self) -> str:
         """Return the Events "event date" value."""
-        return self._group_data.get('firstSeen')
+        return self._group_data.get('eventDate')
 
     @event_date.setter
     def event_date(self, event_date: str):
         """Set the Events "event date" value."""
-        self._group_data['eventDate'] = self.utils.any_to_datetime(event_date).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
-        )
+        self._group_data['eventDate'] = self._format_datetime(event_date)
 
     @property
     def status(self) -> str:
@@ -554,9 +611,7 @@ class Incident(Group):
     @event_date.setter
     def event_date(self, event_date: str):
         """Set Incident event_date."""
-        self._group_data['eventDate'] = self.utils.any_to_datetime(event_date).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
-        )
+        self._group_data['eventDate'] = self._format_datetime(event_date)
 
     @property
     def status(self) -> str:
@@ -634,15 +689,6 @@ class Report(Group):
         # file data/content to upload
         self._file_content = kwargs.get('file_content')
 
-    @property
-    def file_data(self) -> dict:
-        """Return Group files."""
-        return {
-            'fileContent': self._file_content,
-            'fileName': self._group_data.get('fileName'),
-            'type': self._group_data.get('type'),
-        }
-
     @property
     def publish_date(self) -> str:
         """Return Report publish date."""
@@ -651,9 +697,7 @@ class Report(Group):
     @publish_date.setter
     def publish_date(self, publish_date: str):
         """Set Report publish date"""
-        self._group_data['publishDate'] = self.utils.any_to_datetime(publish_date).strftime(
-            '%Y-%m-%dT%H:%M:%SZ'
-        )
+        self._group_data['publishDate'] = self._format_datetime(publish_date)
 
 
 class Signature(Group):
@@ -152,7 +152,6 @@ def gen_model(type_: SnakeString):
     container_private_attrs = gen.gen_container_private_attrs()
     model_fields = gen.gen_model_fields()
     model_private_attrs = gen.gen_model_private_attrs()
-    validator_methods = gen.gen_validator_methods()
 
     _code = gen.gen_doc_string()
     _code += gen.gen_requirements()
@@ -167,8 +166,6 @@ def gen_model(type_: SnakeString):
     _code += gen.gen_model_class()
     _code += model_private_attrs
     _code += model_fields
-    # add validators
-    _code += validator_methods
     # add forward reference requirements
     _code += gen.gen_requirements_first_party_forward_reference()
     # add forward references
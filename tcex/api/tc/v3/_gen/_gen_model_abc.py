@@ -28,7 +28,7 @@ class GenerateModelABC(GenerateABC, ABC):
             ],
             'first-party-forward-reference': [],
         }
-        self.validators = {}
+        self.lazy_models = []
 
     def _add_module_class(self, from_: str, module: str, class_: str):
         """Add pydantic validator only when required."""
@@ -37,36 +37,22 @@ class GenerateModelABC(GenerateABC, ABC):
                 if lib.get('module') == module:
                     lib['imports'].append(class_)
 
-    def _add_pydantic_validator(self):
-        """Add pydantic validator only when required."""
-        self._add_module_class('third-party', 'pydantic', 'validator')
-
     def _add_pydantic_private_attr(self):
         """Add pydantic validator only when required."""
         self._add_module_class('third-party', 'pydantic', 'PrivateAttr')
 
-    def _gen_code_validator_method(self, type_: str, fields: List[str]) -> str:
-        """Return the validator code
+    def _gen_code_lazy_models(self) -> List[str]:
+        """Return the lazy models code
 
-        @validator('artifact_type', always=True)
-        def _validate_artifact_type(cls, v):
-            if not v:
-                return ArtifactTypeModel()
-            return v
+        _lazy_models = ('artifact_type', 'notes')
         """
-        type_ = self.utils.camel_string(type_)
+        if not self.lazy_models:
+            return []
 
-        fields_string = ', '.join(f'\'{field}\'' for field in fields)
-        return '\n'.join(
-            [
-                f'''{self.i1}@validator({fields_string}, always=True)''',
-                f'''{self.i1}def _validate_{type_.snake_case()}(cls, v):''',
-                f'''{self.i2}if not v:''',
-                f'''{self.i3}return {type_}Model()''',
-                f'''{self.i2}return v''',
-                '',
-            ]
-        )
+        fields_string = ', '.join(f'\'{field}\'' for field in sorted(self.lazy_models))
+        if len(self.lazy_models) == 1:
+            fields_string += ','
+        return [f'{self.i1}_lazy_models = ({fields_string})']
 
     # TODO: [low] bsummers - research combining this method with parent method
     # pylint: disable=arguments-differ
@@ -116,7 +102,7 @@ class GenerateModelABC(GenerateABC, ABC):
         class ArtifactsModel(
             BaseModel,
             title='Artifacts Model',
-            alias_generator=Utils().snake_to_camel,
+            alias_generator=Utils.snake_to_camel,
             validate_assignment=True,
         ):
         """
@@ -126,7 +112,7 @@ class GenerateModelABC(GenerateABC, ABC):
                 f'''class {self.type_.plural().pascal_case()}Model(''',
                 f'''{self.i1}BaseModel,''',
                 f'''{self.i1}title='{self.type_.plural().pascal_case()} Model',''',
-                f'''{self.i1}alias_generator=Utils().snake_to_camel,''',
+                f'''{self.i1}alias_generator=Utils.snake_to_camel,''',
                 f'''{self.i1}validate_assignment=True,''',
                 '''):''',
                 f'''{self.i1}"""{self.type_.plural().title()} Model"""''',
@@ -210,7 +196,7 @@ class GenerateModelABC(GenerateABC, ABC):
         class ArtifactDataModel(
             BaseModel,
             title='Artifact Data',
-            alias_generator=Utils().snake_to_camel,
+            alias_generator=Utils.snake_to_camel,
             validate_assignment=True,
         ):
         """
@@ -220,7 +206,7 @@ class GenerateModelABC(GenerateABC, ABC):
                 f'''class {self.type_.singular().pascal_case()}DataModel(''',
                 f'''{self.i1}BaseModel,''',
                 f'''{self.i1}title='{self.type_.singular().pascal_case()} Data Model',''',
-                f'''{self.i1}alias_generator=Utils().snake_to_camel,''',
+                f'''{self.i1}alias_generator=Utils.snake_to_camel,''',
                 f'''{self.i1}validate_assignment=True,''',
                 '''):''',
                 f'''{self.i1}"""{self.type_.plural().title()} Data Model"""''',
@@ -264,7 +250,7 @@ class GenerateModelABC(GenerateABC, ABC):
         class ArtifactModel(
             BaseModel,
             title='Artifact Model',
-            alias_generator=Utils().snake_to_camel,
+            alias_generator=Utils.snake_to_camel,
             validate_assignment=True,
         ):
         """
@@ -273,7 +259,7 @@ class GenerateModelABC(GenerateABC, ABC):
                 '',
                 f'''class {self.type_.singular().pascal_case()}Model(''',
                 f'''{self.i1}V3ModelABC,''',
-                f'''{self.i1}alias_generator=Utils().snake_to_camel,''',
+                f'''{self.i1}alias_generator=Utils.snake_to_camel,''',
                 f'''{self.i1}extra=Extra.allow,''',
                 f'''{self.i1}title='{self.type_.singular().pascal_case()} Model',''',
                 f'''{self.i1}validate_assignment=True,''',
@@ -309,9 +295,9 @@ class GenerateModelABC(GenerateABC, ABC):
                 if prop.extra.import_data and prop.extra.import_source:
                     self.requirements[prop.extra.import_source].append(prop.extra.import_data)
 
-            # add validator
+            # add lazy model (nested model created on first access)
             if prop.extra.model is not None:
-                self.validators.setdefault(prop.type, []).append(prop.name.snake_case())
+                self.lazy_models.append(prop.name.snake_case())
 
             # update model
             _model.append(
@@ -422,6 +408,7 @@ class GenerateModelABC(GenerateABC, ABC):
             [
                 f'{self.i1}_associated_type = PrivateAttr({associated_type})',
                 f'{self.i1}_cm_type = PrivateAttr({cm_type})',
+                *self._gen_code_lazy_models(),
                 f'{self.i1}_shared_type = PrivateAttr({shared_type})',
                 f'{self.i1}_staged = PrivateAttr(False)',
                 '',
@@ -457,22 +444,3 @@ class GenerateModelABC(GenerateABC, ABC):
                 '',
             ]
         )
-
-    def gen_validator_methods(self) -> str:
-        """Generate model validator."""
-        _v = []
-
-        validators = dict(
-            sorted({k: v for k, v in self.validators.items() if v is not None}.items())
-        )
-        for key, fields in validators.items():
-            if not fields:
-                continue
-            _v.append(self._gen_code_validator_method(key, fields))
-
-        # add blank line above validators only if validators exists
-        if _v:
-            _v.insert(0, '')
-            self._add_pydantic_validator()
-
-        return '\n'.join(_v)
@@ -229,6 +229,12 @@ class GenerateObjectABC(GenerateABC, ABC):
     def _gen_code_object_init_method(self) -> str:
         """Return the method code.
 
+        __slots__ = []
+
+        _nested_field_name = 'artifacts'
+        _nested_filter = 'has_artifact'
+        type_ = 'Artifact'
+
         def __init__(self, **kwargs):
             '''Initialize Class properties'''
             super().__init__(kwargs.pop('session', None))
@@ -245,15 +251,18 @@ class GenerateObjectABC(GenerateABC, ABC):
 
         return '\n'.join(
             [
+                f'''{self.i1}__slots__ = []''',
+                '',
+                f'''{self.i1}_nested_field_name = \'{nested_field_name}\'''',
+                f'''{self.i1}_nested_filter = \'has_{self.type_.singular()}\'''',
+                f'''{self.i1}type_ = \'{self.type_.singular().space_case()}\'''',
+                '',
                 f'''{self.i1}def __init__(self, **kwargs):''',
                 f'''{self.i2}"""Initialize class properties."""''',
                 f'''{self.i2}super().__init__(kwargs.pop('session', None))''',
                 '',
                 f'''{self.i2}# properties''',
                 f'''{self.i2}self._model = {self.type_.singular().pascal_case()}Model(**kwargs)''',
-                f'''{self.i2}self._nested_field_name = '{nested_field_name}' ''',
-                f'''{self.i2}self._nested_filter = 'has_{self.type_.singular()}' ''',
-                f'''{self.i2}self.type_ = \'{self.type_.singular().space_case()}\'''',
                 '',
                 '',
             ]
@@ -425,25 +434,63 @@ class GenerateObjectABC(GenerateABC, ABC):
             f'''from {model_import_data.get('model_module')} '''
             f'''import {model_import_data.get('model_class')}'''
         )
-        stage_method = [
-            (
-                f'''{self.i1}def stage_{model_type.singular()}(self, '''
-                f'''data: Union[dict, 'ObjectABC', '{model_import_data.get('model_class')}'''
-                f'''']):'''
-            ),
-            f'''{self.i2}"""Stage {type_.singular()} on the object."""''',
-            f'''{self.i2}if isinstance(data, ObjectABC):''',
-            f'''{self.i3}data = data.model''',
-            f'''{self.i2}elif isinstance(data, dict):''',
-            f'''{self.i3}data = {model_import_data.get('model_class')}(**data)''',
-            '',
-            f'''{self.i2}if not isinstance(data, {model_import_data.get('model_class')}):''',
-            (
-                f'''{self.i3}raise RuntimeError('Invalid type '''
-                f'''passed in to stage_{model_type.singular()}')'''
-            ),
-            f'''{self.i2}data._staged = True''',
-        ]
+        if type_.lower() == 'security_labels':
+            # The SecurityLabelModel has no nested models, so when the caller vouches for the
+            # data (e.g., bulk staging of labels from a previous export) validation can be skipped.
+            self.requirements['standard library'].append(
+                {'module': 'typing', 'imports': ['Optional']}
+            )
+            stage_method = [
+                (
+                    f'''{self.i1}def stage_{model_type.singular()}(self, '''
+                    f'''data: Union[dict, 'ObjectABC', '{model_import_data.get('model_class')}'''
+                    f''''], trusted: Optional[bool] = False):'''
+                ),
+                f'''{self.i2}"""Stage {type_.singular()} on the object.''',
+                '',
+                f'''{self.i2}Args:''',
+                f'''{self.i3}data: The {type_.singular()} data, object, or model to stage.''',
+                (
+                    f'''{self.i3}trusted: If True, a dict is loaded without validation. '''
+                    '''Only use for'''
+                ),
+                f'''{self.i4}well-formed data (e.g., data previously returned by the API).''',
+                f'''{self.i2}"""''',
+                f'''{self.i2}if isinstance(data, ObjectABC):''',
+                f'''{self.i3}data = data.model''',
+                f'''{self.i2}elif isinstance(data, dict) and trusted is True:''',
+                (
+                    f'''{self.i3}data = {model_import_data.get('model_class')}'''
+                    '''.construct_trusted(**data)'''
+                ),
+                f'''{self.i2}elif isinstance(data, dict):''',
+                f'''{self.i3}data = {model_import_data.get('model_class')}(**data)''',
+                '',
+            ]
+        else:
+            stage_method = [
+                (
+                    f'''{self.i1}def stage_{model_type.singular()}(self, '''
+                    f'''data: Union[dict, 'ObjectABC', '{model_import_data.get('model_class')}'''
+                    f'''']):'''
+                ),
+                f'''{self.i2}"""Stage {type_.singular()} on the object."""''',
+                f'''{self.i2}if isinstance(data, ObjectABC):''',
+                f'''{self.i3}data = data.model''',
+                f'''{self.i2}elif isinstance(data, dict):''',
+                f'''{self.i3}data = {model_import_data.get('model_class')}(**data)''',
+                '',
+            ]
+        stage_method.extend(
+            [
+                f'''{self.i2}if not isinstance(data, {model_import_data.get('model_class')}):''',
+                (
+                    f'''{self.i3}raise RuntimeError('Invalid type '''
+                    f'''passed in to stage_{model_type.singular()}')'''
+                ),
+                f'''{self.i2}data._staged = True''',
+            ]
+        )
         if type_.lower() == 'file_actions' and self.type_.lower() == 'indicators':
             # The `indicator` field in the FileActionModel must be staged to be
             # submitted through the API
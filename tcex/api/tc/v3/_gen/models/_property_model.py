@@ -40,7 +40,7 @@ class ExtraModel(
 # pylint: disable=no-self-argument,no-self-use
 class PropertyModel(
     BaseModel,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     arbitrary_types_allowed=True,
     extra=Extra.forbid,
     keep_untouched=(cached_property,),
@@ -52,15 +52,18 @@ class ArtifactTypes(ObjectCollectionABC):
 class ArtifactType(ObjectABC):
     """ArtifactTypes Object."""
 
+    __slots__ = []
+
+    _nested_field_name = 'artifactTypes'
+    _nested_filter = 'has_artifact_type'
+    type_ = 'Artifact Type'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = ArtifactTypeModel(**kwargs)
-        self._nested_field_name = 'artifactTypes'
-        self._nested_filter = 'has_artifact_type'
-        self.type_ = 'Artifact Type'
 
     @property
     def _api_endpoint(self) -> str:
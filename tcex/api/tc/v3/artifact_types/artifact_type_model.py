@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class ArtifactTypesModel(
     BaseModel,
     title='ArtifactTypes Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Artifact_Types Model"""
@@ -38,7 +38,7 @@ class ArtifactTypesModel(
 class ArtifactTypeDataModel(
     BaseModel,
     title='ArtifactType Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Artifact_Types Data Model"""
@@ -53,7 +53,7 @@ class ArtifactTypeDataModel(
 
 class ArtifactTypeModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='ArtifactType Model',
     validate_assignment=True,
@@ -81,15 +81,18 @@ class Artifact(ObjectABC):
         type (str, kwargs): The **type** for the Artifact.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'artifacts'
+    _nested_filter = 'has_artifact'
+    type_ = 'Artifact'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = ArtifactModel(**kwargs)
-        self._nested_field_name = 'artifacts'
-        self._nested_filter = 'has_artifact'
-        self.type_ = 'Artifact'
 
     @property
     def _api_endpoint(self) -> str:
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class ArtifactsModel(
     BaseModel,
     title='Artifacts Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Artifacts Model"""
@@ -39,7 +39,7 @@ class ArtifactsModel(
 class ArtifactDataModel(
     BaseModel,
     title='Artifact Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Artifacts Data Model"""
@@ -54,7 +54,7 @@ class ArtifactDataModel(
 
 class ArtifactModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Artifact Model',
     validate_assignment=True,
@@ -63,6 +63,14 @@ class ArtifactModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(True)
+    _lazy_models = (
+        'artifact_type',
+        'associated_groups',
+        'associated_indicators',
+        'notes',
+        'parent_case',
+        'task',
+    )
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -259,42 +267,6 @@ class ArtifactModel(
         title='type',
     )
 
-    @validator('artifact_type', always=True)
-    def _validate_artifact_type(cls, v):
-        if not v:
-            return ArtifactTypeModel()
-        return v
-
-    @validator('parent_case', always=True)
-    def _validate_case(cls, v):
-        if not v:
-            return CaseModel()
-        return v
-
-    @validator('associated_groups', always=True)
-    def _validate_groups(cls, v):
-        if not v:
-            return GroupsModel()
-        return v
-
-    @validator('associated_indicators', always=True)
-    def _validate_indicators(cls, v):
-        if not v:
-            return IndicatorsModel()
-        return v
-
-    @validator('notes', always=True)
-    def _validate_notes(cls, v):
-        if not v:
-            return NotesModel()
-        return v
-
-    @validator('task', always=True)
-    def _validate_task(cls, v):
-        if not v:
-            return TaskModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.artifact_types.artifact_type_model import ArtifactTypeModel
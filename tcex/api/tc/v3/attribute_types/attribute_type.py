@@ -65,15 +65,18 @@ class AttributeType(ObjectABC):
         validation_rule (object, kwargs): The validation rule that governs the attribute value.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'attributeTypes'
+    _nested_filter = 'has_attribute_type'
+    type_ = 'Attribute Type'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = AttributeTypeModel(**kwargs)
-        self._nested_field_name = 'attributeTypes'
-        self._nested_filter = 'has_attribute_type'
-        self.type_ = 'Attribute Type'
 
     @property
     def _api_endpoint(self) -> str:
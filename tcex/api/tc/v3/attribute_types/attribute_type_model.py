@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class AttributeTypesModel(
     BaseModel,
     title='AttributeTypes Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Attribute_Types Model"""
@@ -38,7 +38,7 @@ class AttributeTypesModel(
 class AttributeTypeDataModel(
     BaseModel,
     title='AttributeType Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Attribute_Types Data Model"""
@@ -53,7 +53,7 @@ class AttributeTypeDataModel(
 
 class AttributeTypeModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='AttributeType Model',
     validate_assignment=True,
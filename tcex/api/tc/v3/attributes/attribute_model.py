@@ -13,7 +13,7 @@ from tcex.utils import Utils
 class AttributesModel(
     BaseModel,
     title='Attributes Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Attributes Model"""
@@ -29,7 +29,7 @@ class AttributesModel(
 class AttributeData(
     BaseModel,
     title='Attribute Data',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Attribute Data"""
@@ -45,7 +45,7 @@ class AttributeData(
 class AttributeModel(
     BaseModel,
     title='Attribute Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     validate_assignment=True,
 ):
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class CaseAttributesModel(
     BaseModel,
     title='CaseAttributes Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Case_Attributes Model"""
@@ -39,7 +39,7 @@ class CaseAttributesModel(
 class CaseAttributeDataModel(
     BaseModel,
     title='CaseAttribute Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Case_Attributes Data Model"""
@@ -54,7 +54,7 @@ class CaseAttributeDataModel(
 
 class CaseAttributeModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='CaseAttribute Model',
     validate_assignment=True,
@@ -63,6 +63,7 @@ class CaseAttributeModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(False)
+    _lazy_models = ('created_by', 'security_labels')
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -150,18 +151,6 @@ class CaseAttributeModel(
         title='value',
     )
 
-    @validator('security_labels', always=True)
-    def _validate_security_labels(cls, v):
-        if not v:
-            return SecurityLabelsModel()
-        return v
-
-    @validator('created_by', always=True)
-    def _validate_user(cls, v):
-        if not v:
-            return UserModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.security.users.user_model import UserModel
@@ -101,15 +101,18 @@ class Case(ObjectABC):
         xid (str, kwargs): The **xid** for the Case.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'cases'
+    _nested_filter = 'has_case'
+    type_ = 'Case'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = CaseModel(**kwargs)
-        self._nested_field_name = 'cases'
-        self._nested_filter = 'has_case'
-        self.type_ = 'Case'
 
     @property
     def _api_endpoint(self) -> str:
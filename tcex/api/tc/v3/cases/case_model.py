@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class CasesModel(
     BaseModel,
     title='Cases Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Cases Model"""
@@ -39,7 +39,7 @@ class CasesModel(
 class CaseDataModel(
     BaseModel,
     title='Case Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Cases Data Model"""
@@ -54,7 +54,7 @@ class CaseDataModel(
 
 class CaseModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Case Model',
     validate_assignment=True,
@@ -63,6 +63,26 @@ class CaseModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(True)
+    _lazy_models = (
+        'artifacts',
+        'assignee',
+        'associated_cases',
+        'associated_groups',
+        'associated_indicators',
+        'attributes',
+        'case_close_user',
+        'case_detection_user',
+        'case_occurrence_user',
+        'case_open_user',
+        'created_by',
+        'notes',
+        'related',
+        'tags',
+        'tasks',
+        'user_access',
+        'workflow_events',
+        'workflow_template',
+    )
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -309,91 +329,6 @@ class CaseModel(
         title='xid',
     )
 
-    @validator('artifacts', always=True)
-    def _validate_artifacts(cls, v):
-        if not v:
-            return ArtifactsModel()
-        return v
-
-    @validator('assignee', always=True)
-    def _validate_assignee(cls, v):
-        if not v:
-            return AssigneeModel()
-        return v
-
-    @validator('attributes', always=True)
-    def _validate_case_attributes(cls, v):
-        if not v:
-            return CaseAttributesModel()
-        return v
-
-    @validator('associated_cases', 'related', always=True)
-    def _validate_cases(cls, v):
-        if not v:
-            return CasesModel()
-        return v
-
-    @validator('associated_groups', always=True)
-    def _validate_groups(cls, v):
-        if not v:
-            return GroupsModel()
-        return v
-
-    @validator('associated_indicators', always=True)
-    def _validate_indicators(cls, v):
-        if not v:
-            return IndicatorsModel()
-        return v
-
-    @validator('notes', always=True)
-    def _validate_notes(cls, v):
-        if not v:
-            return NotesModel()
-        return v
-
-    @validator('tags', always=True)
-    def _validate_tags(cls, v):
-        if not v:
-            return TagsModel()
-        return v
-
-    @validator('tasks', always=True)
-    def _validate_tasks(cls, v):
-        if not v:
-            return TasksModel()
-        return v
-
-    @validator(
-        'case_close_user',
-        'case_detection_user',
-        'case_occurrence_user',
-        'case_open_user',
-        'created_by',
-        always=True,
-    )
-    def _validate_user(cls, v):
-        if not v:
-            return UserModel()
-        return v
-
-    @validator('user_access', always=True)
-    def _validate_users(cls, v):
-        if not v:
-            return UsersModel()
-        return v
-
-    @validator('workflow_events', always=True)
-    def _validate_workflow_events(cls, v):
-        if not v:
-            return WorkflowEventsModel()
-        return v
-
-    @validator('workflow_template', always=True)
-    def _validate_workflow_template(cls, v):
-        if not v:
-            return WorkflowTemplateModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.artifacts.artifact_model import ArtifactsModel
@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class FileActionsModel(
     BaseModel,
     title='File Actions Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """File Actions Model"""
@@ -40,7 +40,7 @@ class FileActionsModel(
 
 class FileActionModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='File Action Model',
     validate_assignment=True,
@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class FileOccurrencesModel(
     BaseModel,
     title='File Occurrences Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """File Occurrences Data Model"""
@@ -41,7 +41,7 @@ class FileOccurrenceModel(
     V3ModelABC,
     title='File Occurrence Model',
     extra=Extra.allow,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """File Occurrences Model"""
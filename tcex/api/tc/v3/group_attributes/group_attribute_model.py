@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class GroupAttributesModel(
     BaseModel,
     title='GroupAttributes Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Group_Attributes Model"""
@@ -39,7 +39,7 @@ class GroupAttributesModel(
 class GroupAttributeDataModel(
     BaseModel,
     title='GroupAttribute Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Group_Attributes Data Model"""
@@ -54,7 +54,7 @@ class GroupAttributeDataModel(
 
 class GroupAttributeModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='GroupAttribute Model',
     validate_assignment=True,
@@ -63,6 +63,7 @@ class GroupAttributeModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(False)
+    _lazy_models = ('created_by', 'group', 'security_labels')
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -157,24 +158,6 @@ class GroupAttributeModel(
         title='value',
     )
 
-    @validator('group', always=True)
-    def _validate_group(cls, v):
-        if not v:
-            return GroupModel()
-        return v
-
-    @validator('security_labels', always=True)
-    def _validate_security_labels(cls, v):
-        if not v:
-            return SecurityLabelsModel()
-        return v
-
-    @validator('created_by', always=True)
-    def _validate_user(cls, v):
-        if not v:
-            return UserModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.groups.group_model import GroupModel
@@ -117,15 +117,18 @@ class Group(ObjectABC):
         xid (str, kwargs): The xid of the item.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'associatedGroups'
+    _nested_filter = 'has_group'
+    type_ = 'Group'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = GroupModel(**kwargs)
-        self._nested_field_name = 'associatedGroups'
-        self._nested_filter = 'has_group'
-        self.type_ = 'Group'
 
     @property
     def _api_endpoint(self) -> str:
@@ -361,10 +364,20 @@ class Group(ObjectABC):
         data._staged = True
         self.model.attributes.data.append(data)
 
-    def stage_security_label(self, data: Union[dict, 'ObjectABC', 'SecurityLabelModel']):
-        """Stage security_label on the object."""
+    def stage_security_label(
+        self, data: Union[dict, 'ObjectABC', 'SecurityLabelModel'], trusted: Optional[bool] = False
+    ):
+        """Stage security_label on the object.
+
+        Args:
+            data: The security_label data, object, or model to stage.
+            trusted: If True, a dict is loaded without validation. Only use for
+                well-formed data (e.g., data previously returned by the API).
+        """
         if isinstance(data, ObjectABC):
             data = data.model
+        elif isinstance(data, dict) and trusted is True:
+            data = SecurityLabelModel.construct_trusted(**data)
         elif isinstance(data, dict):
             data = SecurityLabelModel(**data)
 
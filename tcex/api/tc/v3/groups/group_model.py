@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class GroupsModel(
     BaseModel,
     title='Groups Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Groups Model"""
@@ -39,7 +39,7 @@ class GroupsModel(
 class GroupDataModel(
     BaseModel,
     title='Group Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Groups Data Model"""
@@ -54,7 +54,7 @@ class GroupDataModel(
 
 class GroupModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Group Model',
     validate_assignment=True,
@@ -63,6 +63,18 @@ class GroupModel(
 
     _associated_type = PrivateAttr(True)
     _cm_type = PrivateAttr(False)
+    _lazy_models = (
+        'assignments',
+        'associated_artifacts',
+        'associated_cases',
+        'associated_groups',
+        'associated_indicators',
+        'associated_victim_assets',
+        'attributes',
+        'created_by',
+        'security_labels',
+        'tags',
+    )
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -487,66 +499,6 @@ class GroupModel(
         title='xid',
     )
 
-    @validator('associated_artifacts', always=True)
-    def _validate_artifacts(cls, v):
-        if not v:
-            return ArtifactsModel()
-        return v
-
-    @validator('associated_cases', always=True)
-    def _validate_cases(cls, v):
-        if not v:
-            return CasesModel()
-        return v
-
-    @validator('attributes', always=True)
-    def _validate_group_attributes(cls, v):
-        if not v:
-            return GroupAttributesModel()
-        return v
-
-    @validator('associated_groups', always=True)
-    def _validate_groups(cls, v):
-        if not v:
-            return GroupsModel()
-        return v
-
-    @validator('associated_indicators', always=True)
-    def _validate_indicators(cls, v):
-        if not v:
-            return IndicatorsModel()
-        return v
-
-    @validator('security_labels', always=True)
-    def _validate_security_labels(cls, v):
-        if not v:
-            return SecurityLabelsModel()
-        return v
-
-    @validator('tags', always=True)
-    def _validate_tags(cls, v):
-        if not v:
-            return TagsModel()
-        return v
-
-    @validator('assignments', always=True)
-    def _validate_task_assignees(cls, v):
-        if not v:
-            return TaskAssigneesModel()
-        return v
-
-    @validator('created_by', always=True)
-    def _validate_user(cls, v):
-        if not v:
-            return UserModel()
-        return v
-
-    @validator('associated_victim_assets', always=True)
-    def _validate_victim_assets(cls, v):
-        if not v:
-            return VictimAssetsModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.artifacts.artifact_model import ArtifactsModel
@@ -140,15 +140,18 @@ class Indicator(ObjectABC):
         whois_active (bool, kwargs): Is whois active for the indicator?
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'associatedIndicators'
+    _nested_filter = 'has_indicator'
+    type_ = 'Indicator'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = IndicatorModel(**kwargs)
-        self._nested_field_name = 'associatedIndicators'
-        self._nested_filter = 'has_indicator'
-        self.type_ = 'Indicator'
 
     @property
     def _api_endpoint(self) -> str:
@@ -344,10 +347,20 @@ class Indicator(ObjectABC):
         data._staged = True
         self.model.file_occurrences.data.append(data)
 
-    def stage_security_label(self, data: Union[dict, 'ObjectABC', 'SecurityLabelModel']):
-        """Stage security_label on the object."""
+    def stage_security_label(
+        self, data: Union[dict, 'ObjectABC', 'SecurityLabelModel'], trusted: Optional[bool] = False
+    ):
+        """Stage security_label on the object.
+
+        Args:
+            data: The security_label data, object, or model to stage.
+            trusted: If True, a dict is loaded without validation. Only use for
+                well-formed data (e.g., data previously returned by the API).
+        """
         if isinstance(data, ObjectABC):
             data = data.model
+        elif isinstance(data, dict) and trusted is True:
+            data = SecurityLabelModel.construct_trusted(**data)
         elif isinstance(data, dict):
             data = SecurityLabelModel(**data)
 
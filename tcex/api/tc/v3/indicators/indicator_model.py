@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class IndicatorsModel(
     BaseModel,
     title='Indicators Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Indicators Model"""
@@ -39,7 +39,7 @@ class IndicatorsModel(
 class IndicatorDataModel(
     BaseModel,
     title='Indicator Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Indicators Data Model"""
@@ -54,7 +54,7 @@ class IndicatorDataModel(
 
 class IndicatorModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Indicator Model',
     validate_assignment=True,
@@ -63,6 +63,17 @@ class IndicatorModel(
 
     _associated_type = PrivateAttr(True)
     _cm_type = PrivateAttr(False)
+    _lazy_models = (
+        'associated_artifacts',
+        'associated_cases',
+        'associated_groups',
+        'associated_indicators',
+        'attributes',
+        'file_actions',
+        'file_occurrences',
+        'security_labels',
+        'tags',
+    )
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -490,60 +501,6 @@ class IndicatorModel(
         title='whoisActive',
     )
 
-    @validator('associated_artifacts', always=True)
-    def _validate_artifacts(cls, v):
-        if not v:
-            return ArtifactsModel()
-        return v
-
-    @validator('associated_cases', always=True)
-    def _validate_cases(cls, v):
-        if not v:
-            return CasesModel()
-        return v
-
-    @validator('file_actions', always=True)
-    def _validate_file_actions(cls, v):
-        if not v:
-            return FileActionsModel()
-        return v
-
-    @validator('file_occurrences', always=True)
-    def _validate_file_occurrences(cls, v):
-        if not v:
-            return FileOccurrencesModel()
-        return v
-
-    @validator('associated_groups', always=True)
-    def _validate_groups(cls, v):
-        if not v:
-            return GroupsModel()
-        return v
-
-    @validator('attributes', always=True)
-    def _validate_indicator_attributes(cls, v):
-        if not v:
-            return IndicatorAttributesModel()
-        return v
-
-    @validator('associated_indicators', always=True)
-    def _validate_indicators(cls, v):
-        if not v:
-            return IndicatorsModel()
-        return v
-
-    @validator('security_labels', always=True)
-    def _validate_security_labels(cls, v):
-        if not v:
-            return SecurityLabelsModel()
-        return v
-
-    @validator('tags', always=True)
-    def _validate_tags(cls, v):
-        if not v:
-            return TagsModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.artifacts.artifact_model import ArtifactsModel
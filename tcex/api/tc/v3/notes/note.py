@@ -62,15 +62,18 @@ class Note(ObjectABC):
         workflow_event_id (int, kwargs): The ID of the Event on which to apply the Note.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'notes'
+    _nested_filter = 'has_note'
+    type_ = 'Note'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = NoteModel(**kwargs)
-        self._nested_field_name = 'notes'
-        self._nested_filter = 'has_note'
-        self.type_ = 'Note'
 
     @property
     def _api_endpoint(self) -> str:
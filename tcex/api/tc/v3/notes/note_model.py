@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class NotesModel(
     BaseModel,
     title='Notes Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Notes Model"""
@@ -39,7 +39,7 @@ class NotesModel(
 class NoteDataModel(
     BaseModel,
     title='Note Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Notes Data Model"""
@@ -54,7 +54,7 @@ class NoteDataModel(
 
 class NoteModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Note Model',
     validate_assignment=True,
@@ -63,6 +63,7 @@ class NoteModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(True)
+    _lazy_models = ('artifact', 'parent_case', 'task', 'workflow_event')
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -189,30 +190,6 @@ class NoteModel(
         title='workflowEventId',
     )
 
-    @validator('artifact', always=True)
-    def _validate_artifact(cls, v):
-        if not v:
-            return ArtifactModel()
-        return v
-
-    @validator('parent_case', always=True)
-    def _validate_case(cls, v):
-        if not v:
-            return CaseModel()
-        return v
-
-    @validator('task', always=True)
-    def _validate_task(cls, v):
-        if not v:
-            return TaskModel()
-        return v
-
-    @validator('workflow_event', always=True)
-    def _validate_workflow_event(cls, v):
-        if not v:
-            return WorkflowEventModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.artifacts.artifact_model import ArtifactModel
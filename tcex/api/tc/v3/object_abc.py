@@ -13,7 +13,6 @@ from requests.exceptions import ProxyError, RetryError
 
 # first-party
 from tcex.api.tc.v3.tql.tql_operator import TqlOperator
-from tcex.backports import cached_property
 from tcex.exit.error_codes import handle_error
 from tcex.utils import Utils
 
@@ -34,12 +33,31 @@ class ObjectABC(ABC):
     methods are used.
     """
 
+    __slots__ = [
+        '_fields',
+        '_model',
+        '_parent_data',
+        '_properties',
+        '_remove_objects',
+        '_session',
+        'log',
+        'request',
+        'utils',
+    ]
+
+    # define/overwritten in child class
+    _nested_field_name = None
+    _nested_filter = None
+    type_ = None
+
     def __init__(self, session):
         """Initialize class properties."""
         self._session = session
 
         # properties
+        self._fields = None
         self._parent_data = {}
+        self._properties = None
         self._remove_objects = {
             'associations': [],
             'attributes': [],
@@ -52,9 +70,6 @@ class ObjectABC(ABC):
 
         # define/overwritten in child class
         self._model = None
-        self._nested_field_name = None
-        self._nested_filter = None
-        self.type_ = None
 
     @property
     def _api_endpoint(self) -> dict:  # pragma: no cover
@@ -195,14 +210,15 @@ class ObjectABC(ABC):
 
         return self.request
 
-    @cached_property
+    @property
     def fields(self) -> Dict[str, str]:
         """Return the field data for this object."""
-        _fields = {}
-        r = self._session.options(f'{self._api_endpoint}/fields', params={})
-        if r.ok:
-            _fields = r.json().get('data', {})
-        return _fields
+        if self._fields is None:
+            self._fields = {}
+            r = self._session.options(f'{self._api_endpoint}/fields', params={})
+            if r.ok:
+                self._fields = r.json().get('data', {})
+        return self._fields
 
     def gen_params(self, params: List[dict]) -> List[dict]:
         """Return appropriate params values."""
@@ -285,12 +301,15 @@ class ObjectABC(ABC):
         else:
             raise RuntimeError(f'Invalid data type: {type(data)} provided.')
 
-    @cached_property
+    @property
     def properties(self) -> dict:
         """Return defined API properties for the current object.
 
         This property is used in testing API consistency.
         """
+        if self._properties is not None:
+            return self._properties
+
         _properties = []
         try:
             r = self._session.options(
@@ -310,6 +329,7 @@ class ObjectABC(ABC):
                     self._api_endpoint,
                 ],
             )
+        self._properties = _properties
         return _properties
 
     @staticmethod
@@ -1,5 +1,7 @@
 """Case Management Collection Abstract Base Class"""
 # standard library
+import collections
+import concurrent.futures
 import logging
 from abc import ABC
 from typing import TYPE_CHECKING, Optional, Union
@@ -8,6 +10,12 @@ from typing import TYPE_CHECKING, Optional, Union
 from requests import Response
 from requests.exceptions import ProxyError, RetryError
 
+try:
+    # third-party
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # orjson is an optional faster JSON decoder
+
 # first-party
 from tcex.api.tc.v3.tql.tql import Tql
 from tcex.backports import cached_property
@@ -62,7 +70,9 @@ class ObjectCollectionABC(ABC):
         # properties
         self._session = session
         self.log = logger
+        self.prefetch_pages = 1
         self.request = None
+        self.result_limit = 500
         self.tql = Tql()
         self._model = None
         self.type_ = None  # defined in child class
@@ -100,6 +110,33 @@ class ObjectCollectionABC(ABC):
         """Return filter method."""
         raise NotImplementedError('Child class must implement this method.')
 
+    @staticmethod
+    def _decode_response(response: Response) -> dict:
+        """Return the decoded JSON response body, using orjson when available."""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _handle_response(self, response: Response):
+        """Set the current request and validate the response."""
+        self.request = response
+        self.log.debug(f'feature=api-tc-v3, request-body={self.request.request.body}')
+
+        if not self.success(self.request):
+            err = self.request.text or self.request.reason
+            handle_error(
+                code=950,
+                message_values=[
+                    self.request.request.method.upper(),
+                    self.request.status_code,
+                    err,
+                    self.request.url,
+                ],
+            )
+
+        # log content for debugging
+        self.log_response_text(self.request)
+
     def _request(
         self,
         method: str,
@@ -109,11 +146,19 @@ class ObjectCollectionABC(ABC):
         headers: Optional[dict] = None,
     ):
         """Handle standard request with error checking."""
+        self._handle_response(self._send(method, url, body, params, headers))
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Union[bytes, str]] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Response:
+        """Send the request, handling connection errors."""
         try:
-            self.request = self._session.request(
-                method, url, data=body, headers=headers, params=params
-            )
-            self.log.debug(f'feature=api-tc-v3, request-body={self.request.request.body}')
+            return self._session.request(method, url, data=body, headers=headers, params=params)
         except (ConnectionError, ProxyError, RetryError):  # pragma: no cover
             handle_error(
                 code=951,
@@ -124,21 +169,7 @@ class ObjectCollectionABC(ABC):
                     url,
                 ],
             )
-
-        if not self.success(self.request):
-            err = self.request.text or self.request.reason
-            handle_error(
-                code=950,
-                message_values=[
-                    self.request.request.method.upper(),
-                    self.request.status_code,
-                    err,
-                    self.request.url,
-                ],
-            )
-
-        # log content for debugging
-        self.log_response_text(self.request)
+            return None
 
     @property
     def filter(self):  # pragma: no cover
@@ -181,24 +212,30 @@ class ObjectCollectionABC(ABC):
             k = self.utils.snake_to_camel(k)
             params[k] = v
 
+        # request larger pages than the API default to reduce the number of round trips
+        params.setdefault('resultLimit', self.result_limit)
+
         tql_string = self.tql.raw_tql or self.tql.as_str
 
         if tql_string:
             params['tql'] = tql_string
 
-        while True:
-            self._request(
-                'GET',
-                body=None,
-                url=url,
-                headers={'content-type': 'application/json'},
-                params=params,
-            )
+        if self.prefetch_pages > 1:
+            yield from self._iterate_prefetch(base_class, url, params)
+            return
 
-            # reset some vars
-            params = {}
+        self._request(
+            'GET',
+            body=None,
+            url=url,
+            headers={'content-type': 'application/json'},
+            params=params,
+        )
+        yield from self._iterate_next(base_class, self._decode_response(self.request))
 
-            response = self.request.json()
+    def _iterate_next(self, base_class: 'BaseModel', response: dict) -> 'CaseManagementType':
+        """Yield the objects from the response and each following page using the next url."""
+        while True:
             data = response.get('data', [])
             url = response.pop('next', None)
 
@@ -209,6 +246,65 @@ class ObjectCollectionABC(ABC):
             if not url:
                 break
 
+            self._request(
+                'GET',
+                body=None,
+                url=url,
+                headers={'content-type': 'application/json'},
+                params={},
+            )
+            response = self._decode_response(self.request)
+
+    def _iterate_prefetch(
+        self, base_class: 'BaseModel', url: str, params: dict
+    ) -> 'CaseManagementType':
+        """Iterate over CM/TI objects, fetching up to prefetch_pages pages concurrently.
+
+        The first page is requested with the count parameter so that the offsets of the
+        remaining pages can be calculated. Results are yielded in page order. If the response
+        has no count, the remaining pages are requested one at a time using the next url.
+        """
+        headers = {'content-type': 'application/json'}
+        self._request('GET', body=None, url=url, headers=headers, params={**params, 'count': True})
+        response = self._decode_response(self.request)
+
+        if 'count' not in response:
+            yield from self._iterate_next(base_class, response)
+            return
+
+        result_limit = int(params['resultLimit'])
+        result_start = int(params.get('resultStart', 0))
+        count = response['count']
+
+        # build the params for each remaining page
+        page_params = []
+        for offset in range(result_start + result_limit, count, result_limit):
+            page_params.append({**params, 'resultStart': offset})
+
+        for result in response.get('data', []):
+            yield base_class(session=self._session, **result)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.prefetch_pages) as executor:
+            # keep at most prefetch_pages requests in flight ahead of the consumer
+            futures = collections.deque()
+            for page in page_params:
+                futures.append(executor.submit(self._send, 'GET', url, None, page, headers))
+                if len(futures) < self.prefetch_pages:
+                    continue
+
+                yield from self._iterate_prefetch_page(base_class, futures.popleft())
+
+            while futures:
+                yield from self._iterate_prefetch_page(base_class, futures.popleft())
+
+    def _iterate_prefetch_page(
+        self, base_class: 'BaseModel', future: 'concurrent.futures.Future'
+    ) -> 'CaseManagementType':
+        """Yield the objects from a prefetched page."""
+        self._handle_response(future.result())
+        for result in self._decode_response(self.request).get('data', []):
+            yield base_class(session=self._session, **result)
+
     # @staticmethod
     # def list_as_dict(added_items: 'CaseManagementType') -> dict:
     #     """Return the dict representation of the case management collection object."""
@@ -16,7 +16,7 @@ from tcex.utils import Utils
 class AssigneeModel(
     V3ModelABC,
     title='User Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Assignee Model"""
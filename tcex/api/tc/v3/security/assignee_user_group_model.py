@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class AssigneeUserGroupModel(
     UserGroupModel,
     title='Assignee User Group Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Assignee Model"""
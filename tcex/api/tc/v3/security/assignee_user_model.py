@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class AssigneeUserModel(
     UserModel,
     title='Assignee User Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Assignee Model"""
@@ -52,15 +52,18 @@ class OwnerRoles(ObjectCollectionABC):
 class OwnerRole(ObjectABC):
     """OwnerRoles Object."""
 
+    __slots__ = []
+
+    _nested_field_name = 'ownerRoles'
+    _nested_filter = 'has_owner_role'
+    type_ = 'Owner Role'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = OwnerRoleModel(**kwargs)
-        self._nested_field_name = 'ownerRoles'
-        self._nested_filter = 'has_owner_role'
-        self.type_ = 'Owner Role'
 
     @property
     def _api_endpoint(self) -> str:
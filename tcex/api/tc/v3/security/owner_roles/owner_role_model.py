@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class OwnerRolesModel(
     BaseModel,
     title='OwnerRoles Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Owner_Roles Model"""
@@ -38,7 +38,7 @@ class OwnerRolesModel(
 class OwnerRoleDataModel(
     BaseModel,
     title='OwnerRole Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Owner_Roles Data Model"""
@@ -53,7 +53,7 @@ class OwnerRoleDataModel(
 
 class OwnerRoleModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='OwnerRole Model',
     validate_assignment=True,
@@ -52,15 +52,18 @@ class Owners(ObjectCollectionABC):
 class Owner(ObjectABC):
     """Owners Object."""
 
+    __slots__ = []
+
+    _nested_field_name = 'owners'
+    _nested_filter = 'has_owner'
+    type_ = 'Owner'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = OwnerModel(**kwargs)
-        self._nested_field_name = 'owners'
-        self._nested_filter = 'has_owner'
-        self.type_ = 'Owner'
 
     @property
     def _api_endpoint(self) -> str:
@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class OwnersModel(
     BaseModel,
     title='Owners Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Owners Model"""
@@ -38,7 +38,7 @@ class OwnersModel(
 class OwnerDataModel(
     BaseModel,
     title='Owner Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Owners Data Model"""
@@ -53,7 +53,7 @@ class OwnerDataModel(
 
 class OwnerModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Owner Model',
     validate_assignment=True,
@@ -52,15 +52,18 @@ class SystemRoles(ObjectCollectionABC):
 class SystemRole(ObjectABC):
     """SystemRoles Object."""
 
+    __slots__ = []
+
+    _nested_field_name = 'systemRoles'
+    _nested_filter = 'has_system_role'
+    type_ = 'System Role'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = SystemRoleModel(**kwargs)
-        self._nested_field_name = 'systemRoles'
-        self._nested_filter = 'has_system_role'
-        self.type_ = 'System Role'
 
     @property
     def _api_endpoint(self) -> str:
@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class SystemRolesModel(
     BaseModel,
     title='SystemRoles Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """System_Roles Model"""
@@ -38,7 +38,7 @@ class SystemRolesModel(
 class SystemRoleDataModel(
     BaseModel,
     title='SystemRole Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """System_Roles Data Model"""
@@ -53,7 +53,7 @@ class SystemRoleDataModel(
 
 class SystemRoleModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='SystemRole Model',
     validate_assignment=True,
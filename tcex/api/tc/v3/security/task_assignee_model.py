@@ -24,7 +24,7 @@ class AssigneeTypes(str, Enum):
 class TaskAssigneesModel(
     BaseModel,
     title='User Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Task Assignees Model"""
@@ -49,7 +49,7 @@ class TaskAssigneesModel(
 class TaskAssigneeModel(
     V3ModelABC,
     title='User Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Task Assignee Model
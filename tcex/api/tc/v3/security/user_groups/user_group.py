@@ -52,15 +52,18 @@ class UserGroups(ObjectCollectionABC):
 class UserGroup(ObjectABC):
     """UserGroups Object."""
 
+    __slots__ = []
+
+    _nested_field_name = 'userGroups'
+    _nested_filter = 'has_user_group'
+    type_ = 'User Group'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = UserGroupModel(**kwargs)
-        self._nested_field_name = 'userGroups'
-        self._nested_filter = 'has_user_group'
-        self.type_ = 'User Group'
 
     @property
     def _api_endpoint(self) -> str:
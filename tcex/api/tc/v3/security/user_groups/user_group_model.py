@@ -4,7 +4,7 @@
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class UserGroupsModel(
     BaseModel,
     title='UserGroups Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """User_Groups Model"""
@@ -38,7 +38,7 @@ class UserGroupsModel(
 class UserGroupDataModel(
     BaseModel,
     title='UserGroup Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """User_Groups Data Model"""
@@ -53,7 +53,7 @@ class UserGroupDataModel(
 
 class UserGroupModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='UserGroup Model',
     validate_assignment=True,
@@ -62,6 +62,7 @@ class UserGroupModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(False)
+    _lazy_models = ('users',)
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -93,12 +94,6 @@ class UserGroupModel(
         title='users',
     )
 
-    @validator('users', always=True)
-    def _validate_users(cls, v):
-        if not v:
-            return UsersModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.security.users.user_model import UsersModel
@@ -52,15 +52,18 @@ class Users(ObjectCollectionABC):
 class User(ObjectABC):
     """Users Object."""
 
+    __slots__ = []
+
+    _nested_field_name = 'users'
+    _nested_filter = 'has_user'
+    type_ = 'User'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = UserModel(**kwargs)
-        self._nested_field_name = 'users'
-        self._nested_filter = 'has_user'
-        self.type_ = 'User'
 
     @property
     def _api_endpoint(self) -> str:
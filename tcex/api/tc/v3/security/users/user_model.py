@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class UsersModel(
     BaseModel,
     title='Users Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Users Model"""
@@ -38,7 +38,7 @@ class UsersModel(
 class UserDataModel(
     BaseModel,
     title='User Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Users Data Model"""
@@ -53,7 +53,7 @@ class UserDataModel(
 
 class UserModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='User Model',
     validate_assignment=True,
@@ -63,15 +63,18 @@ class SecurityLabel(ObjectABC):
         owner (str, kwargs): The name of the Owner of the Label.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'securityLabels'
+    _nested_filter = 'has_security_label'
+    type_ = 'Security Label'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = SecurityLabelModel(**kwargs)
-        self._nested_field_name = 'securityLabels'
-        self._nested_filter = 'has_security_label'
-        self.type_ = 'Security Label'
 
     @property
     def _api_endpoint(self) -> str:
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class SecurityLabelsModel(
     BaseModel,
     title='SecurityLabels Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Security_Labels Model"""
@@ -39,7 +39,7 @@ class SecurityLabelsModel(
 class SecurityLabelDataModel(
     BaseModel,
     title='SecurityLabel Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Security_Labels Data Model"""
@@ -54,7 +54,7 @@ class SecurityLabelDataModel(
 
 class SecurityLabelModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='SecurityLabel Model',
     validate_assignment=True,
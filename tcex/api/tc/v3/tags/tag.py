@@ -59,15 +59,18 @@ class Tag(ObjectABC):
         owner (str, kwargs): The name of the Owner of the Tag.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'tags'
+    _nested_filter = 'has_tag'
+    type_ = 'Tag'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = TagModel(**kwargs)
-        self._nested_field_name = 'tags'
-        self._nested_filter = 'has_tag'
-        self.type_ = 'Tag'
 
     @property
     def _api_endpoint(self) -> str:
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class TagsModel(
     BaseModel,
     title='Tags Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Tags Model"""
@@ -39,7 +39,7 @@ class TagsModel(
 class TagDataModel(
     BaseModel,
     title='Tag Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Tags Data Model"""
@@ -54,7 +54,7 @@ class TagDataModel(
 
 class TagModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Tag Model',
     validate_assignment=True,
@@ -63,6 +63,7 @@ class TagModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(False)
+    _lazy_models = ('cases', 'groups', 'indicators', 'victims')
     _shared_type = PrivateAttr(True)
     _staged = PrivateAttr(False)
 
@@ -133,30 +134,6 @@ class TagModel(
         title='victims',
     )
 
-    @validator('cases', always=True)
-    def _validate_cases(cls, v):
-        if not v:
-            return CasesModel()
-        return v
-
-    @validator('groups', always=True)
-    def _validate_groups(cls, v):
-        if not v:
-            return GroupsModel()
-        return v
-
-    @validator('indicators', always=True)
-    def _validate_indicators(cls, v):
-        if not v:
-            return IndicatorsModel()
-        return v
-
-    @validator('victims', always=True)
-    def _validate_victims(cls, v):
-        if not v:
-            return VictimsModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.cases.case_model import CasesModel
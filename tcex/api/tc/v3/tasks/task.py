@@ -80,15 +80,18 @@ class Task(ObjectABC):
         xid (str, kwargs): The **xid** for the Task.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'tasks'
+    _nested_filter = 'has_task'
+    type_ = 'Task'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = TaskModel(**kwargs)
-        self._nested_field_name = 'tasks'
-        self._nested_filter = 'has_task'
-        self.type_ = 'Task'
 
     @property
     def _api_endpoint(self) -> str:
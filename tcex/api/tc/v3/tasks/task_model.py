@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional, Union
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class TasksModel(
     BaseModel,
     title='Tasks Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Tasks Model"""
@@ -39,7 +39,7 @@ class TasksModel(
 class TaskDataModel(
     BaseModel,
     title='Task Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Tasks Data Model"""
@@ -54,7 +54,7 @@ class TaskDataModel(
 
 class TaskModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Task Model',
     validate_assignment=True,
@@ -63,6 +63,7 @@ class TaskModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(True)
+    _lazy_models = ('artifacts', 'assignee', 'notes', 'parent_case')
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -239,30 +240,6 @@ class TaskModel(
         title='xid',
     )
 
-    @validator('artifacts', always=True)
-    def _validate_artifacts(cls, v):
-        if not v:
-            return ArtifactsModel()
-        return v
-
-    @validator('assignee', always=True)
-    def _validate_assignee(cls, v):
-        if not v:
-            return AssigneeModel()
-        return v
-
-    @validator('parent_case', always=True)
-    def _validate_case(cls, v):
-        if not v:
-            return CaseModel()
-        return v
-
-    @validator('notes', always=True)
-    def _validate_notes(cls, v):
-        if not v:
-            return NotesModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.artifacts.artifact_model import ArtifactsModel
@@ -5,6 +5,7 @@ import hashlib
 import json
 import logging
 from abc import ABC
+from copy import deepcopy
 from json import JSONEncoder
 from typing import Any, Optional
 
@@ -31,29 +32,87 @@ class CustomJSONEncoder(JSONEncoder):
         return o
 
 
+class LazyModelField:
+    """Descriptor that creates an empty nested model on first access.
+
+    Nested model fields (e.g., tags, security_labels) are left as None when not provided
+    and only replaced with an empty model when the field is read or the model is serialized.
+    """
+
+    def __init__(self, name: str):
+        """Initialize class properties."""
+        self.name = name
+
+    def __get__(self, instance: Optional[BaseModel], owner: type) -> Any:
+        """Return the nested model, creating an empty model when not set."""
+        if instance is None:
+            return self
+
+        value = instance.__dict__.get(self.name)
+        if value is None:
+            value = owner.__fields__[self.name].type_()
+            instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance: BaseModel, value: Any):
+        """Set the nested model."""
+        instance.__dict__[self.name] = value
+
+
 class V3ModelABC(BaseModel, ABC):
     """V3 Base Model"""
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(False)
-    _dict_hash: str = PrivateAttr()
+    _init_data = PrivateAttr(None)
+    _init_hash = PrivateAttr(None)
+    _lazy_models = ()
     _log = logger
+    _modified = PrivateAttr(False)
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
     id: int = None
 
+    def __init_subclass__(cls, **kwargs):
+        """Install lazy descriptors for nested model fields."""
+        super().__init_subclass__(**kwargs)
+        for name in cls._lazy_models:
+            setattr(cls, name, LazyModelField(name))
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(**kwargs)
 
+        # keep a snapshot of the input data, used by updated to detect in-place changes
+        if kwargs:
+            self._init_data = deepcopy(kwargs)
+
         # when "id" field is present it indicates that the data was returned from the
         # API, otherwise the assumption is that the developer staged the data during
         # instantiation of the object.
         if kwargs and hasattr(self, 'id') and self.id is None:  # pylint: disable=no-member
             self._staged = True
 
-        # store initial dict hash of model
-        self._dict_hash = self.gen_model_hash(self.json(sort_keys=True))
+    def _iter(self, *args, **kwargs):
+        """Create any unset nested models before the model is serialized.
+
+        dict(), json() and == all use this method, so their output does not depend on which
+        lazy nested fields have been read.
+        """
+        for name in self._lazy_models:
+            getattr(self, name)
+        yield from super()._iter(*args, **kwargs)
+
+    def __setattr__(self, name: str, value: Any):
+        """Set the value and flag the model as modified when a field value changes."""
+        if name in self.__private_attributes__ or self._modified is True:
+            super().__setattr__(name, value)
+            return
+
+        current_value = self.__dict__.get(name)
+        super().__setattr__(name, value)
+        if self.__dict__.get(name) != current_value:
+            self._modified = True
 
     def _calculate_field_inclusion(
         self, field: str, method: str, mode: str, nested: bool, property_: dict, value: Any
@@ -318,6 +377,16 @@ class V3ModelABC(BaseModel, ABC):
             return schema.get('properties')
         return schema.get('definitions').get(self.__class__.__name__).get('properties')
 
+    @classmethod
+    def construct_trusted(cls, **data) -> 'V3ModelABC':
+        """Return a model created from trusted data without validation.
+
+        construct() does not apply field aliases, so the API field names (e.g., dateAdded) are
+        converted to the model field names first. Values are stored as provided.
+        """
+        aliases = {field.alias: name for name, field in cls.__fields__.items()}
+        return cls.construct(**{aliases.get(key, key): value for key, value in data.items()})
+
     @staticmethod
     def gen_model_hash(json_: str) -> str:
         """Return the current dict hash."""
@@ -419,6 +488,18 @@ class V3ModelABC(BaseModel, ABC):
         )
 
     @property
-    def updated(self):
-        """Return True if model values have changed, else False."""
-        return self._dict_hash != self.gen_model_hash(self.json(sort_keys=True))
+    def updated(self) -> bool:
+        """Return True if model values have changed, else False.
+
+        Field assignments are tracked as they happen. In-place changes (e.g., staged nested
+        objects) are found by comparing the model hash to the hash of a model built from a
+        snapshot of the input data. The initial hash is only calculated once.
+        """
+        if self._modified is True or (self._init_data is None and self._init_hash is None):
+            return self._modified
+
+        if self._init_hash is None:
+            initial_model = type(self)(**self._init_data)
+            self._init_hash = self.gen_model_hash(initial_model.json(sort_keys=True))
+            self._init_data = None
+        return self.gen_model_hash(self.json(sort_keys=True)) != self._init_hash
@@ -71,15 +71,18 @@ class VictimAsset(ObjectABC):
         website (str, kwargs): The website of the asset.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'victimAssets'
+    _nested_filter = 'has_victim_asset'
+    type_ = 'Victim Asset'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = VictimAssetModel(**kwargs)
-        self._nested_field_name = 'victimAssets'
-        self._nested_filter = 'has_victim_asset'
-        self.type_ = 'Victim Asset'
 
     @property
     def _api_endpoint(self) -> str:
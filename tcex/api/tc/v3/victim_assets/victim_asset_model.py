@@ -4,7 +4,7 @@
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class VictimAssetsModel(
     BaseModel,
     title='VictimAssets Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Victim_Assets Model"""
@@ -38,7 +38,7 @@ class VictimAssetsModel(
 class VictimAssetDataModel(
     BaseModel,
     title='VictimAsset Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Victim_Assets Data Model"""
@@ -53,7 +53,7 @@ class VictimAssetDataModel(
 
 class VictimAssetModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='VictimAsset Model',
     validate_assignment=True,
@@ -62,6 +62,7 @@ class VictimAssetModel(
 
     _associated_type = PrivateAttr(True)
     _cm_type = PrivateAttr(False)
+    _lazy_models = ('associated_groups',)
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -171,12 +172,6 @@ class VictimAssetModel(
         title='website',
     )
 
-    @validator('associated_groups', always=True)
-    def _validate_groups(cls, v):
-        if not v:
-            return GroupsModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.groups.group_model import GroupsModel
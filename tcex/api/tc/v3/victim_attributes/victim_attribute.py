@@ -1,6 +1,6 @@
 """VictimAttribute / VictimAttributes Object"""
 # standard library
-from typing import TYPE_CHECKING, Iterator, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 # first-party
 from tcex.api.tc.v3.api_endpoints import ApiEndpoints
@@ -73,15 +73,18 @@ class VictimAttribute(ObjectABC):
         victim_id (int, kwargs): Victim associated with attribute.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'victimAttributes'
+    _nested_filter = 'has_victim_attribute'
+    type_ = 'Victim Attribute'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = VictimAttributeModel(**kwargs)
-        self._nested_field_name = 'victimAttributes'
-        self._nested_filter = 'has_victim_attribute'
-        self.type_ = 'Victim Attribute'
 
     @property
     def _api_endpoint(self) -> str:
@@ -113,10 +116,20 @@ class VictimAttribute(ObjectABC):
 
         yield from self._iterate_over_sublist(SecurityLabels)
 
-    def stage_security_label(self, data: Union[dict, 'ObjectABC', 'SecurityLabelModel']):
-        """Stage security_label on the object."""
+    def stage_security_label(
+        self, data: Union[dict, 'ObjectABC', 'SecurityLabelModel'], trusted: Optional[bool] = False
+    ):
+        """Stage security_label on the object.
+
+        Args:
+            data: The security_label data, object, or model to stage.
+            trusted: If True, a dict is loaded without validation. Only use for
+                well-formed data (e.g., data previously returned by the API).
+        """
         if isinstance(data, ObjectABC):
             data = data.model
+        elif isinstance(data, dict) and trusted is True:
+            data = SecurityLabelModel.construct_trusted(**data)
         elif isinstance(data, dict):
             data = SecurityLabelModel(**data)
 
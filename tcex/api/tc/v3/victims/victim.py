@@ -1,6 +1,6 @@
 """Victim / Victims Object"""
 # standard library
-from typing import TYPE_CHECKING, Iterator, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 # first-party
 from tcex.api.tc.v3.api_endpoints import ApiEndpoints
@@ -80,15 +80,18 @@ class Victim(ObjectABC):
         work_location (str, kwargs): Work location of the Victim.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'victims'
+    _nested_filter = 'has_victim'
+    type_ = 'Victim'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = VictimModel(**kwargs)
-        self._nested_field_name = 'victims'
-        self._nested_filter = 'has_victim'
-        self.type_ = 'Victim'
 
     @property
     def _api_endpoint(self) -> str:
@@ -183,10 +186,20 @@ class Victim(ObjectABC):
         data._staged = True
         self.model.attributes.data.append(data)
 
-    def stage_security_label(self, data: Union[dict, 'ObjectABC', 'SecurityLabelModel']):
-        """Stage security_label on the object."""
+    def stage_security_label(
+        self, data: Union[dict, 'ObjectABC', 'SecurityLabelModel'], trusted: Optional[bool] = False
+    ):
+        """Stage security_label on the object.
+
+        Args:
+            data: The security_label data, object, or model to stage.
+            trusted: If True, a dict is loaded without validation. Only use for
+                well-formed data (e.g., data previously returned by the API).
+        """
         if isinstance(data, ObjectABC):
             data = data.model
+        elif isinstance(data, dict) and trusted is True:
+            data = SecurityLabelModel.construct_trusted(**data)
         elif isinstance(data, dict):
             data = SecurityLabelModel(**data)
 
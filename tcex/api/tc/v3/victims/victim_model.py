@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class VictimsModel(
     BaseModel,
     title='Victims Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Victims Model"""
@@ -39,7 +39,7 @@ class VictimsModel(
 class VictimDataModel(
     BaseModel,
     title='Victim Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Victims Data Model"""
@@ -54,7 +54,7 @@ class VictimDataModel(
 
 class VictimModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='Victim Model',
     validate_assignment=True,
@@ -63,6 +63,7 @@ class VictimModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(False)
+    _lazy_models = ('assets', 'associated_groups', 'attributes', 'security_labels', 'tags')
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -189,36 +190,6 @@ class VictimModel(
         title='workLocation',
     )
 
-    @validator('associated_groups', always=True)
-    def _validate_groups(cls, v):
-        if not v:
-            return GroupsModel()
-        return v
-
-    @validator('security_labels', always=True)
-    def _validate_security_labels(cls, v):
-        if not v:
-            return SecurityLabelsModel()
-        return v
-
-    @validator('tags', always=True)
-    def _validate_tags(cls, v):
-        if not v:
-            return TagsModel()
-        return v
-
-    @validator('assets', always=True)
-    def _validate_victim_assets(cls, v):
-        if not v:
-            return VictimAssetsModel()
-        return v
-
-    @validator('attributes', always=True)
-    def _validate_victim_attributes(cls, v):
-        if not v:
-            return VictimAttributesModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.groups.group_model import GroupsModel
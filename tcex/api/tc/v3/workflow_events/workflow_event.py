@@ -70,15 +70,18 @@ class WorkflowEvent(ObjectABC):
         summary (str, kwargs): The **summary** for the Workflow_Event.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'workflowEvents'
+    _nested_filter = 'has_workflow_event'
+    type_ = 'Workflow Event'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = WorkflowEventModel(**kwargs)
-        self._nested_field_name = 'workflowEvents'
-        self._nested_filter = 'has_workflow_event'
-        self.type_ = 'Workflow Event'
 
     @property
     def _api_endpoint(self) -> str:
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -15,7 +15,7 @@ from tcex.utils import Utils
 class WorkflowEventsModel(
     BaseModel,
     title='WorkflowEvents Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Workflow_Events Model"""
@@ -39,7 +39,7 @@ class WorkflowEventsModel(
 class WorkflowEventDataModel(
     BaseModel,
     title='WorkflowEvent Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Workflow_Events Data Model"""
@@ -54,7 +54,7 @@ class WorkflowEventDataModel(
 
 class WorkflowEventModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='WorkflowEvent Model',
     validate_assignment=True,
@@ -63,6 +63,7 @@ class WorkflowEventModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(True)
+    _lazy_models = ('notes', 'parent_case', 'user')
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -170,24 +171,6 @@ class WorkflowEventModel(
         title='user',
     )
 
-    @validator('parent_case', always=True)
-    def _validate_case(cls, v):
-        if not v:
-            return CaseModel()
-        return v
-
-    @validator('notes', always=True)
-    def _validate_notes(cls, v):
-        if not v:
-            return NotesModel()
-        return v
-
-    @validator('user', always=True)
-    def _validate_user(cls, v):
-        if not v:
-            return UserModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.cases.case_model import CaseModel
@@ -62,15 +62,18 @@ class WorkflowTemplate(ObjectABC):
         version (int, kwargs): The **version** for the Workflow_Template.
     """
 
+    __slots__ = []
+
+    _nested_field_name = 'workflowTemplates'
+    _nested_filter = 'has_workflow_template'
+    type_ = 'Workflow Template'
+
     def __init__(self, **kwargs):
         """Initialize class properties."""
         super().__init__(kwargs.pop('session', None))
 
         # properties
         self._model = WorkflowTemplateModel(**kwargs)
-        self._nested_field_name = 'workflowTemplates'
-        self._nested_filter = 'has_workflow_template'
-        self.type_ = 'Workflow Template'
 
     @property
     def _api_endpoint(self) -> str:
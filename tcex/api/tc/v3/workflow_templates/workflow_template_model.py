@@ -4,7 +4,7 @@
 from typing import List, Optional, Union
 
 # third-party
-from pydantic import BaseModel, Extra, Field, PrivateAttr, validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr
 
 # first-party
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
@@ -14,7 +14,7 @@ from tcex.utils import Utils
 class WorkflowTemplatesModel(
     BaseModel,
     title='WorkflowTemplates Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Workflow_Templates Model"""
@@ -38,7 +38,7 @@ class WorkflowTemplatesModel(
 class WorkflowTemplateDataModel(
     BaseModel,
     title='WorkflowTemplate Data Model',
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     validate_assignment=True,
 ):
     """Workflow_Templates Data Model"""
@@ -53,7 +53,7 @@ class WorkflowTemplateDataModel(
 
 class WorkflowTemplateModel(
     V3ModelABC,
-    alias_generator=Utils().snake_to_camel,
+    alias_generator=Utils.snake_to_camel,
     extra=Extra.allow,
     title='WorkflowTemplate Model',
     validate_assignment=True,
@@ -62,6 +62,7 @@ class WorkflowTemplateModel(
 
     _associated_type = PrivateAttr(False)
     _cm_type = PrivateAttr(True)
+    _lazy_models = ('assignee', 'cases')
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
 
@@ -161,18 +162,6 @@ class WorkflowTemplateModel(
         title='version',
     )
 
-    @validator('assignee', always=True)
-    def _validate_assignee(cls, v):
-        if not v:
-            return AssigneeModel()
-        return v
-
-    @validator('cases', always=True)
-    def _validate_cases(cls, v):
-        if not v:
-            return CasesModel()
-        return v
-
 
 # first-party
 from tcex.api.tc.v3.cases.case_model import CasesModel
@@ -83,15 +83,16 @@ def conditional_required(rules: List[Dict[str, str]] = True) -> Any:
         """Return True if input is NOT in value list."""
         return input_ not in value
 
+    # build the operator map once per validator instead of on every lookup
+    operators = {
+        'eq': operator.eq,
+        'in': is_in,
+        'ne': operator.ne,
+        'ni': not_in,
+    }
+
     def get_operator(op):
         """Get the corresponding operator"""
-
-        operators = {
-            'eq': operator.eq,
-            'in': is_in,
-            'ne': operator.ne,
-            'ni': not_in,
-        }
         return operators.get(op, operator.eq)
 
     def _conditional_required(value: str, field: 'ModelField', values: Dict[str, Any]):
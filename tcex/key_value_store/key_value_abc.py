@@ -1,7 +1,11 @@
 """KeyValueABC class."""
 # standard library
+import logging
 from abc import ABC
-from typing import Any
+from typing import Any, Dict, List
+
+# get tcex logger
+logger = logging.getLogger('tcex')
 
 
 class KeyValueABC(ABC):
@@ -19,6 +23,55 @@ class KeyValueABC(ABC):
             (string): The response from the KV store provider.
         """
 
+    def create_many(self, context: str, data: Dict[str, Any]) -> Any:
+        """Create multiple key/value pairs in KV store.
+
+        KV stores that support writing multiple keys in a single call should override
+        this method, the default creates each key/value pair individually. A RuntimeError
+        raised for a key is logged and the remaining keys are still created.
+
+        Args:
+            context: A specific context for the create.
+            data: The key/value pairs to store in KV store.
+
+        Returns:
+            (list): The response from the KV store provider for each key, None on failure.
+        """
+        results = []
+        for key, value in data.items():
+            try:
+                results.append(self.create(context, key, value))
+            except RuntimeError as e:
+                logger.error(e)
+                results.append(None)
+        return results
+
+    def delete(self, context: str, key: str) -> Any:
+        """Delete key/value pair from KV store.
+
+        Args:
+            context: A specific context for the delete.
+            key: The key to delete in KV store.
+
+        Returns:
+            (any): The response from the KV store provider.
+        """
+
+    def delete_many(self, context: str, keys: List[str]) -> Any:
+        """Delete multiple keys from KV store.
+
+        KV stores that support deleting multiple keys in a single call should override
+        this method, the default deletes each key individually.
+
+        Args:
+            context: A specific context for the delete.
+            keys: The keys to delete in KV store.
+
+        Returns:
+            (any): The response from the KV store provider.
+        """
+        return [self.delete(context, key) for key in keys]
+
     def read(self, context: str, key: str) -> Any:
         """Read data from KV store for the provided key.
 
@@ -1,6 +1,7 @@
 """TcEx Framework Key Value Redis Module"""
 # standard library
-from typing import TYPE_CHECKING, Any, Optional
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 # first-party
 # first party
@@ -10,6 +11,9 @@ if TYPE_CHECKING:
     # first-party
     from tcex.key_value_store.redis_client import RedisClient
 
+# get tcex logger
+logger = logging.getLogger('tcex')
+
 
 class KeyValueRedis(KeyValueABC):
     """TcEx Key Value Redis Module.
@@ -38,6 +42,31 @@ class KeyValueRedis(KeyValueABC):
         """
         return self.redis_client.hset(context, key, value)
 
+    def create_many(self, context: str, data: Dict[str, Any]) -> List[int]:
+        """Create multiple key/value pairs in Redis using a single pipeline.
+
+        An error returned by Redis for a key is logged and the remaining keys are still
+        created.
+
+        Args:
+            context: A specific context for the create.
+            data: The field names (keys) and values for the kv pairs in Redis.
+
+        Returns:
+            list: The responses from Redis for each key, None on failure.
+        """
+        pipeline = self.redis_client.pipeline()
+        for key, value in data.items():
+            pipeline.hset(context, key, value)
+
+        results = []
+        for key, result in zip(data, pipeline.execute(raise_on_error=False)):
+            if isinstance(result, Exception):
+                logger.error(f'Failed to create key {key} ({result}).')
+                result = None
+            results.append(result)
+        return results
+
     def delete(self, context: str, key: str) -> str:
         """Alias for hdel method.
 
@@ -50,6 +79,18 @@ class KeyValueRedis(KeyValueABC):
         """
         return self.redis_client.hdel(context, key)
 
+    def delete_many(self, context: str, keys: List[str]) -> int:
+        """Delete multiple keys using a single HDEL command.
+
+        Args:
+            context: A specific context for the delete.
+            keys: The field names (keys) for the kv pairs in Redis.
+
+        Returns:
+            int: The response from Redis.
+        """
+        return self.redis_client.hdel(context, *keys)
+
     def get_all(self, context: 'Optional[str]') -> 'Any':
         """Return the contents for a given context.
 
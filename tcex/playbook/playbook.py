@@ -25,6 +25,10 @@ class Playbook:
             startup, but for service Apps each request gets a different context.
         output_variables: The requested output variables. For PB Apps outputs are provided on
             startup, but for service Apps each request gets different outputs.
+        read_cache_size: The maximum number of input values cached by read, 0 disables the read
+            cache. Only creates and deletes made through this instance invalidate the cache, so
+            disable it when input data can be written by another Playbook instance, KV store
+            client, or process while this instance is in use.
     """
 
     def __init__(
@@ -32,25 +36,35 @@ class Playbook:
         key_value_store: Union[KeyValueApi, KeyValueRedis],
         context: Optional[str] = None,
         output_variables: Optional[list] = None,
+        read_cache_size: Optional[int] = 512,
     ):
         """Initialize the class properties."""
         self.context = context
         self.key_value_store = key_value_store
         self.output_variables = output_variables or []
+        self.read_cache_size = read_cache_size
 
         # properties
         self.log = logger
         self.utils = Utils()
 
+        # raw input data read by this instance during the App run, shared with create/delete
+        # for invalidation
+        self._read_cache = {}
+
+        # the keys of the requested output variables, built on first use
+        self._output_variable_keys = None
+
     def check_key_requested(self, key: str) -> bool:
         """Return True if output key was requested by downstream app.
 
         Provide key should be in format "app.output".
         """
-        return key in [
-            self.utils.get_playbook_variable_model(variable).key
-            for variable in self.output_variables
-        ]
+        if self._output_variable_keys is None:
+            self._output_variable_keys = frozenset(
+                self.utils.get_playbook_variable(variable).key for variable in self.output_variables
+            )
+        return key in self._output_variable_keys
 
     def check_variable_requested(self, variable: str) -> bool:
         """Return True if output variable was requested by downstream app.
@@ -78,12 +92,14 @@ class Playbook:
     @cached_property
     def create(self) -> 'PlaybookCreate':
         """Return instance of PlaybookCreate"""
-        return PlaybookCreate(self.context, self.key_value_store, self.output_variables)
+        return PlaybookCreate(
+            self.context, self.key_value_store, self.output_variables, self._read_cache
+        )
 
     @cached_property
     def delete(self) -> 'PlaybookDelete':
         """Return instance of PlaybookDelete"""
-        return PlaybookDelete(self.context, self.key_value_store)
+        return PlaybookDelete(self.context, self.key_value_store, self._read_cache)
 
     def is_variable(self, key: str) -> bool:
         """Return True if provided key is a properly formatted playbook variable."""
@@ -97,4 +113,10 @@ class Playbook:
     @cached_property
     def read(self) -> 'PlaybookRead':
         """Return instance of PlaybookRead"""
-        return PlaybookRead(self.context, self.key_value_store)
+        return PlaybookRead(
+            self.context,
+            self.key_value_store,
+            self._read_cache,
+            self.output_variables,
+            self.read_cache_size,
+        )
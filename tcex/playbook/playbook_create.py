@@ -4,6 +4,7 @@ import base64
 import json
 import logging
 import os
+from contextlib import contextmanager
 from typing import Any, Dict, Iterable, List, Optional, Union
 
 # third-party
@@ -18,20 +19,30 @@ logger = logging.getLogger('tcex')
 
 
 class PlaybookCreate:
-    """Playbook Write ABC"""
+    """Playbook Write ABC
+
+    Args:
+        context: The KV Store context/session_id.
+        key_value_store: A KV store instance.
+        output_variables: The requested output variables.
+        read_cache: The read cache of the PlaybookRead instance, keys are invalidated on create.
+    """
 
     def __init__(
         self,
         context: str,
         key_value_store: Union[KeyValueApi, KeyValueRedis],
         output_variables: list,
+        read_cache: Optional[dict] = None,
     ):
         """Initialize the class properties."""
         self.context = context
         self.key_value_store = key_value_store
         self.output_variables = output_variables
+        self.read_cache = read_cache if read_cache is not None else {}
 
         # properties
+        self._deferred = None
         self.log = logger
         self.utils = Utils()
 
@@ -102,6 +113,12 @@ class PlaybookCreate:
     def _create_data(self, key: str, value: Any):
         """Write data to key value store."""
         self.log.debug(f'writing variable {key.strip()}')
+        self.read_cache.pop(key.strip(), None)
+        if self._deferred is not None:
+            # the data will be written when the deferred context exits
+            self._deferred[key.strip()] = value
+            return None
+
         try:
             return self.key_value_store.create(self.context, key.strip(), value)
         except RuntimeError as e:  # pragma: no cover
@@ -125,10 +142,8 @@ class PlaybookCreate:
         if not self.utils.is_playbook_variable(key):
             # try to lookup the variable in the requested output variables.
             for output_variable in self.output_variables:
-                variable_model = self.utils.get_playbook_variable_model(output_variable)
-                if variable_model.key == key and (
-                    variable_type is None or variable_model.type == variable_type
-                ):
+                _, _, output_key, output_type = self.utils.get_playbook_variable(output_variable)
+                if output_key == key and (variable_type is None or output_type == variable_type):
                     # either an exact match, or first match
                     return output_variable
             # not requested by downstream App or misconfigured
@@ -305,6 +320,34 @@ class PlaybookCreate:
         value = self._serialize_data(value)
         return self._create_data(variable, value)
 
+    @contextmanager
+    def deferred(self):
+        """Defer all writes in the context and create them in the KV store in a single call.
+
+        Create methods called inside the context return None, since the data is not written
+        until the context exits. If an exception is raised in the context the deferred data
+        is discarded and the exception is raised to the caller. A failed write for a key is
+        logged by the KV store and the remaining keys are still created.
+        """
+        if self._deferred is not None:
+            # already deferred, the outer context will create the data
+            yield
+            return
+
+        self._deferred = {}
+        try:
+            yield
+        except BaseException:
+            self._deferred = None
+            raise
+
+        data, self._deferred = self._deferred, None
+        if data:
+            self.log.debug(f'writing {len(data)} deferred variables')
+            for key in data:
+                self.read_cache.pop(key, None)
+            self.key_value_store.create_many(self.context, data)
+
     def key_value(
         self,
         key: str,
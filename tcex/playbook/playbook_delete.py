@@ -1,7 +1,7 @@
 """Playbook delete."""
 # standard library
 import logging
-from typing import Union
+from typing import Any, Iterable, Optional, Union
 
 # first-party
 from tcex.key_value_store import KeyValueApi, KeyValueRedis
@@ -12,16 +12,24 @@ logger = logging.getLogger('tcex')
 
 
 class PlaybookDelete:
-    """Playbook Write ABC"""
+    """Playbook Write ABC
+
+    Args:
+        context: The KV Store context/session_id.
+        key_value_store: A KV store instance.
+        read_cache: The read cache of the PlaybookRead instance, keys are invalidated on delete.
+    """
 
     def __init__(
         self,
         context: str,
         key_value_store: Union[KeyValueApi, KeyValueRedis],
+        read_cache: Optional[dict] = None,
     ):
         """Initialize the class properties."""
         self.context = context
         self.key_value_store = key_value_store
+        self.read_cache = read_cache if read_cache is not None else {}
 
         # properties
         self.log = logger
@@ -34,7 +42,19 @@ class PlaybookDelete:
         """
         data = None
         if key is not None:
+            self.read_cache.pop(key.strip(), None)
             data = self.key_value_store.delete(self.context, key.strip())
         else:  # pragma: no cover
             self.log.warning('The key field was None.')
         return data
+
+    def variables(self, keys: Iterable[str]) -> Any:
+        """Delete method of CRUD operation for multiple variables in a single call."""
+        keys = [key.strip() for key in keys if key is not None]
+        if not keys:  # pragma: no cover
+            self.log.warning('No keys were provided.')
+            return None
+
+        for key in keys:
+            self.read_cache.pop(key, None)
+        return self.key_value_store.delete_many(self.context, keys)
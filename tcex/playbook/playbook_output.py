@@ -25,5 +25,6 @@ class PlaybookOutput(dict):
 
     def process(self):
         """Create all stored output data to storage."""
-        for key, value in self.items():
-            self.playbook.create.variable(key, value)
+        with self.playbook.create.deferred():
+            for key, value in self.items():
+                self.playbook.create.variable(key, value)
@@ -4,9 +4,14 @@ import base64
 import json
 import logging
 import re
-from collections import OrderedDict
 from typing import Any, List, Optional, Union
 
+try:
+    # third-party
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # orjson is an optional faster JSON decoder
+
 # first-party
 from tcex.key_value_store import KeyValueApi, KeyValueRedis
 from tcex.pleb.registry import registry
@@ -24,18 +29,31 @@ class PlaybookRead:
         key_value_store: A KV store instance.
         context: The KV Store context/session_id. For PB Apps the context is provided on
             startup, but for service Apps each request gets a different context.
+        read_cache: A dict used to cache the raw data read from the KV store for a single App
+            run. The creator of the dict is responsible for invalidating keys when they are
+            created or deleted.
         output_variables: The requested output variables. For PB Apps outputs are provided on
-            startup, but for service Apps each request gets different outputs.
+            startup, but for service Apps each request gets different outputs. Data for these
+            variables can be written during the App run (e.g., by another Playbook instance)
+            and is never cached.
+        read_cache_size: The maximum number of KV store values held in the read cache, 0
+            disables the read cache.
     """
 
     def __init__(
         self,
         context: str,
         key_value_store: Union[KeyValueApi, KeyValueRedis],
+        read_cache: Optional[dict] = None,
+        output_variables: Optional[list] = None,
+        read_cache_size: Optional[int] = 512,
     ):
         """Initialize the class properties."""
         self.context = context
         self.key_value_store = key_value_store
+        self.read_cache = read_cache if read_cache_size else None
+        self.output_variables = frozenset(ov.strip() for ov in output_variables or [])
+        self.read_cache_size = read_cache_size
 
         # properties
         self.log = logger
@@ -74,18 +92,38 @@ class PlaybookRead:
 
     def _get_data(self, key: str) -> Any:
         """Get the value from Redis if applicable."""
+        key = key.strip()
+        if self.read_cache is not None and key in self.read_cache:
+            return self.read_cache[key]
+
         value = None
         try:
-            value = self.key_value_store.read(self.context, key.strip())
+            value = self.key_value_store.read(self.context, key)
         except RuntimeError as e:
             self.log.error(e)
+            return value
+
+        # only input data is cached, it is written by upstream Apps and does not change
+        # during the App run. missing keys are not cached as they can be written later.
+        if self.read_cache is not None and value is not None and key not in self.output_variables:
+            if len(self.read_cache) >= self.read_cache_size:
+                # evict the oldest entry
+                self.read_cache.pop(next(iter(self.read_cache)))
+            self.read_cache[key] = value
         return value
 
     @staticmethod
     def _load_data(value: str) -> dict:
         """Return the loaded JSON value or raise an error."""
+        if orjson is not None:
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                # fall back to json, which also accepts values orjson rejects (e.g., NaN)
+                pass
+
         try:
-            return json.loads(value, object_pairs_hook=OrderedDict)
+            return json.loads(value)
         except ValueError as e:  # pragma: no cover
             raise RuntimeError(f'Failed to JSON load data "{value}" ({e}).')
 
@@ -185,7 +185,10 @@ class TcEx:
         return ExitService(inputs)
 
     def get_playbook(
-        self, context: Optional[str] = None, output_variables: Optional[list] = None
+        self,
+        context: Optional[str] = None,
+        output_variables: Optional[list] = None,
+        read_cache_size: Optional[int] = 512,
     ) -> 'Playbook':
         """Return a new instance of playbook module.
 
@@ -194,8 +197,10 @@ class TcEx:
                 startup, but for service Apps each request gets a different context.
             output_variables: The requested output variables. For PB Apps outputs are provided on
                 startup, but for service Apps each request gets different outputs.
+            read_cache_size: The maximum number of input values cached by read, 0 disables the
+                read cache.
         """
-        return Playbook(self.key_value_store, context, output_variables)
+        return Playbook(self.key_value_store, context, output_variables, read_cache_size)
 
     @staticmethod
     def get_redis_client(
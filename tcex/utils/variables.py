@@ -1,7 +1,8 @@
 """TcEx Utilities Variables Operations Module"""
 # standard library
 import re
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional
 
 # first-party
 from tcex.utils.models import PlaybookVariableModel
@@ -19,23 +20,39 @@ class StringVariable(str):
     _variable_type = 'String'
 
 
+class PlaybookVariable(NamedTuple):
+    """Parsed playbook variable (e.g., #App:1234:output!String)."""
+
+    app_type: str
+    job_id: str
+    key: str
+    type: str
+
+
 class Variables:
     """TcEx Utilities Variables Class"""
 
+    def get_playbook_variable(self, variable: str) -> Optional[PlaybookVariable]:
+        """Return the parsed playbook variable (e.g., #App:1234:output!String).
+
+        The parsed variable is an immutable named tuple that is cached per variable string, so
+        it can be unpacked (e.g., app_type, job_id, key, type_) without copying a model.
+        """
+        return _parse_playbook_variable(variable)
+
     def get_playbook_variable_model(self, variable: str) -> 'PlaybookVariableModel':
-        """Return data model of playbook variable (e.g., #App:1234:output!String)."""
-        data = None
-        if variable is not None:
-            variable = variable.strip()
-            if re.match(self.variable_playbook_match, variable):
-                var = re.search(self.variable_playbook_parse, variable)
-                data = PlaybookVariableModel(**var.groupdict())
-        return data
+        """Return data model of playbook variable (e.g., #App:1234:output!String).
+
+        The parsed model is cached per variable string, a copy is returned so callers can not
+        modify the cached model.
+        """
+        model = _get_playbook_variable_model(variable)
+        return None if model is None else model.copy()
 
     def get_playbook_variable_type(self, variable: str) -> str:
         """Get variable type"""
-        model = self.get_playbook_variable_model(variable)
-        return 'String' if model is None else model.type
+        parsed_variable = _parse_playbook_variable(variable)
+        return 'String' if parsed_variable is None else parsed_variable.type
 
     def is_playbook_variable(self, key: str) -> bool:
         """Return True if provided key is a properly formatted playbook variable."""
@@ -199,3 +216,25 @@ class Variables:
     def variable_playbook_types(self) -> List[str]:
         """Return list of standard playbook variable types."""
         return self.variable_playbook_single_types + self.variable_playbook_array_types
+
+
+@lru_cache(maxsize=1024)
+def _parse_playbook_variable(variable: str) -> Optional[PlaybookVariable]:
+    """Return the cached parsed playbook variable, keyed only on the variable string."""
+    data = None
+    if variable is not None:
+        variable = variable.strip()
+        variables = Variables()
+        if re.match(variables.variable_playbook_match, variable):
+            var = re.search(variables.variable_playbook_parse, variable)
+            data = PlaybookVariable(**var.groupdict())
+    return data
+
+
+@lru_cache(maxsize=1024)
+def _get_playbook_variable_model(variable: str) -> Optional['PlaybookVariableModel']:
+    """Return the cached data model of playbook variable, keyed only on the variable string."""
+    parsed_variable = _parse_playbook_variable(variable)
+    if parsed_variable is None:
+        return None
+    return PlaybookVariableModel(**parsed_variable._asdict())
@@ -0,0 +1,200 @@
+"""Test the TcEx Batch Group Module."""
+# standard library
+import json
+import uuid
+from datetime import datetime, timezone
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.group import Adversary, Email, Event
+
+
+# pylint: disable=no-self-use
+class TestGroup:
+    """Test the TcEx Batch Group Module."""
+
+    def test_group_slots(self):
+        """Test that Group objects do not have an instance dict."""
+        ti = Adversary(name='pytest-adversary', xid='pytest-xid')
+
+        assert not hasattr(ti, '__dict__')
+        with pytest.raises(AttributeError):
+            ti.unknown = 'unknown'  # pylint: disable=attribute-defined-outside-init
+
+    @pytest.mark.parametrize('kwargs', [{}, {'xid': None}])
+    def test_group_xid_generated(self, kwargs: dict):
+        """Test that a generated xid has the uuid4 string format."""
+        xids = {Adversary(name='pytest-adversary', **kwargs).xid for _ in range(100)}
+
+        assert len(xids) == 100
+        for xid in xids:
+            assert str(uuid.UUID(xid)) == xid
+            assert uuid.UUID(xid).version == 4
+            assert uuid.UUID(xid).variant == uuid.RFC_4122
+
+    def test_group_xid_provided(self):
+        """Test that a provided xid is not replaced."""
+        assert Adversary(name='pytest-adversary', xid='pytest-xid').xid == 'pytest-xid'
+
+    def test_group_data(self):
+        """Test that data is rebuilt after attributes, labels, or tags are added."""
+        ti = Adversary(name='pytest-adversary', xid='pytest-xid')
+        assert ti.data == {'name': 'pytest-adversary', 'type': 'Adversary', 'xid': 'pytest-xid'}
+
+        attribute = ti.attribute('Description', 'pytest description')
+        ti.security_label('TLP:WHITE')
+        ti.tag('pytest-tag')
+        assert ti.data['attribute'] == [{'type': 'Description', 'value': 'pytest description'}]
+        assert ti.data['securityLabel'] == [{'name': 'TLP:WHITE'}]
+        assert ti.data['tag'] == [{'name': 'pytest-tag'}]
+
+        # changes made after data is built are included in data
+        attribute.displayed = True
+        ti.add_key_value('status', 'Active')
+        ti.attribute('Source', 'pytest source')
+        ti.tag('pytest-tag-2')
+        assert ti.data['attribute'] == [
+            {'displayed': True, 'type': 'Description', 'value': 'pytest description'},
+            {'type': 'Source', 'value': 'pytest source'},
+        ]
+        assert ti.data['status'] == 'Active'
+        assert ti.data['tag'] == [{'name': 'pytest-tag'}, {'name': 'pytest-tag-2'}]
+
+    def test_group_data_invalid(self):
+        """Test that attributes and tags without a value are not included in data."""
+        ti = Adversary(name='pytest-adversary', xid='pytest-xid')
+        ti.attribute('Description', '')
+        ti.attribute('Source', 'pytest source')
+        ti.tag(None)
+        ti.tag('pytest-tag')
+
+        assert ti.data['attribute'] == [{'type': 'Source', 'value': 'pytest source'}]
+        assert ti.data['tag'] == [{'name': 'pytest-tag'}]
+
+    def test_group_attribute_unique(self):
+        """Test attribute dedupe for each unique option."""
+        ti = Adversary(name='pytest-adversary', xid='pytest-xid')
+
+        # unique=True returns the existing attribute for the same type and value
+        attribute = ti.attribute('Description', 'pytest description')
+        assert ti.attribute('Description', 'pytest description') is attribute
+        assert ti.attribute('Source', 'pytest description') is not attribute
+
+        # the formatted value is used for the unique check
+        assert ti.attribute('Description', 'PYTEST DESCRIPTION', formatter=str.lower) is attribute
+
+        # unique=False allows the same type and value
+        ti.attribute('Source', 'pytest source', unique=False)
+        ti.attribute('Source', 'pytest source', unique=False)
+
+        # unique='Type' replaces the existing attribute of the same type
+        ti.attribute('Title', 'pytest title 1', unique='Type')
+        ti.attribute('Title', 'pytest title 2', unique='Type')
+
+        assert ti.data['attribute'] == [
+            {'type': 'Description', 'value': 'pytest description'},
+            {'type': 'Source', 'value': 'pytest description'},
+            {'type': 'Source', 'value': 'pytest source'},
+            {'type': 'Source', 'value': 'pytest source'},
+            {'type': 'Title', 'value': 'pytest title 2'},
+        ]
+
+    def test_group_security_label_unique(self):
+        """Test that a security label with the same name is only added once."""
+        ti = Adversary(name='pytest-adversary', xid='pytest-xid')
+        label = ti.security_label('TLP:WHITE', 'pytest description', 'FFFFFF')
+
+        assert ti.security_label('TLP:WHITE') is label
+        assert ti.data['securityLabel'] == [
+            {'color': 'FFFFFF', 'description': 'pytest description', 'name': 'TLP:WHITE'}
+        ]
+
+    def test_group_tag_unique(self):
+        """Test that a tag with the same name is only added once."""
+        ti = Adversary(name='pytest-adversary', xid='pytest-xid')
+        tag = ti.tag('pytest-tag')
+
+        assert ti.tag('pytest-tag') is tag
+        assert ti.data['tag'] == [{'name': 'pytest-tag'}]
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            '2021-01-02T03:04:05Z',
+            '2021-01-02 03:04:05Z',
+            '2021-01-02T03:04:05',
+            datetime(2021, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            1609556645,
+        ],
+    )
+    def test_group_format_datetime(self, value):
+        """Test that datetime expressions are formatted for batch."""
+        ti = Event(name='pytest-event', date_added=value, event_date=value, xid='pytest-xid')
+        assert ti.date_added == '2021-01-02T03:04:05Z'
+        assert ti.event_date == '2021-01-02T03:04:05Z'
+
+        ti.date_added = value
+        assert ti.date_added == '2021-01-02T03:04:05Z'
+
+    def test_group_format_datetime_invalid(self):
+        """Test that an invalid datetime in the batch format is not returned unchanged."""
+        with pytest.raises(RuntimeError):
+            Event(name='pytest-event', event_date='2021-13-02T03:04:05Z')
+
+    def test_email_from_addr(self):
+        """Test that the Email from_addr getter returns the from address."""
+        ti = Email(
+            'pytest-email',
+            'subject',
+            'header',
+            'body',
+            from_addr='from@tci.ninja',
+            to_addr='to@tci.ninja',
+        )
+        assert ti.from_addr == 'from@tci.ninja'
+        assert ti.data['from'] == 'from@tci.ninja'
+
+        ti.from_addr = 'from-2@tci.ninja'
+        assert ti.from_addr == 'from-2@tci.ninja'
+
+    def test_event_event_date(self):
+        """Test that the Event event_date getter returns the event date."""
+        ti = Event(name='pytest-event', first_seen='2020-01-01T00:00:00Z')
+        assert ti.event_date is None
+
+        ti.event_date = '2021-01-02T03:04:05Z'
+        assert ti.event_date == '2021-01-02T03:04:05Z'
+        assert ti.data['eventDate'] == '2021-01-02T03:04:05Z'
+
+    @pytest.mark.parametrize(
+        'key,value',
+        [
+            ('status', 'Active'),
+            ('status', 'Activé'),
+            ('empty', []),
+            ('empty', {}),
+            ('rating', 1.5),
+            ('rating', 1e16),
+            ('rating', 1e-05),
+            ('rating', float('nan')),
+            ('rating', 2**64),
+            ('rating', None),
+            ('displayed', True),
+        ],
+    )
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_group_str(self, key: str, value: object, use_orjson: bool, monkeypatch):
+        """Test that the string representation is the same with and without orjson."""
+        if use_orjson is False:
+            monkeypatch.setattr('tcex.api.tc.v2.batch.group.orjson', None)
+
+        ti = Adversary(name='pytest-adversary', xid='pytest-xid')
+        ti.add_key_value(key, value)
+        ti.attribute('Description', 'pytest description', source='pytest')
+        ti.security_label('TLP:WHITE', 'pytest description', 'FFFFFF')
+        ti.tag('pytest-tag')
+        ti.tag('pytest-tag-2')
+
+        assert str(ti) == json.dumps(ti.data, indent=4)
@@ -0,0 +1,62 @@
+"""Test the TcEx API V3 Object Abstract Base Class."""
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v3.groups.group import Group
+from tcex.api.tc.v3.tags.tag import Tag
+
+
+class MockResponse:
+    """Mock OPTIONS response."""
+
+    ok = True
+
+    def __init__(self, data: dict):
+        """Initialize class properties."""
+        self.data = data
+
+    def json(self) -> dict:
+        """Return the response data."""
+        return self.data
+
+
+class MockSession:
+    """Mock TC API session counting OPTIONS requests."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.urls = []
+
+    def options(self, url: str, params=None, headers=None) -> MockResponse:
+        """Return the field or property data for the url."""
+        self.urls.append(url)
+        if url.endswith('/fields'):
+            return MockResponse({'data': [{'name': 'tags'}]})
+        return MockResponse({'name': {'type': 'String'}})
+
+
+# pylint: disable=no-self-use
+class TestObjectABC:
+    """Test the TcEx API V3 Object Abstract Base Class."""
+
+    @pytest.mark.parametrize('object_class', [Group, Tag])
+    def test_object_slots(self, object_class: type):
+        """Test that objects do not have an instance dict."""
+        obj = object_class(name='pytest')
+
+        assert not hasattr(obj, '__dict__')
+        with pytest.raises(AttributeError):
+            obj.unknown = 'unknown'  # pylint: disable=attribute-defined-outside-init
+
+    def test_object_fields_properties_cached(self):
+        """Test that the fields and properties are requested once per object."""
+        session = MockSession()
+        group = Group(session=session, name='pytest')
+
+        assert group.fields == [{'name': 'tags'}]
+        assert group.fields == [{'name': 'tags'}]
+        assert group.available_fields == ['tags']
+        assert group.properties == {'name': {'type': 'String'}}
+        assert group.properties == {'name': {'type': 'String'}}
+        assert session.urls == ['/v3/groups/fields', '/v3/groups']
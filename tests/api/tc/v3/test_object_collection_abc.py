@@ -0,0 +1,175 @@
+"""Test the TcEx API V3 Collection Abstract Base Class."""
+# standard library
+import json
+import threading
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+
+# third-party
+import pytest
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.api.tc.v3.object_collection_abc import ObjectCollectionABC
+from tcex.api.tc.v3.tags.tag import Tags
+
+
+class MockSession:
+    """Mock TC API session returning pages of tags.
+
+    Args:
+        total: The number of tags available on the mock server.
+        fail_start: The resultStart value of a page that returns an error response.
+        raise_start: The resultStart value of a page that raises an exception.
+        return_count: If False, the count is not returned even when requested.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        fail_start: Optional[int] = None,
+        raise_start: Optional[int] = None,
+        return_count: bool = True,
+    ):
+        """Initialize class properties."""
+        self.fail_start = fail_start
+        self.raise_start = raise_start
+        self.return_count = return_count
+        self.lock = threading.Lock()
+        self.params = []
+        self.tags = [{'id': i, 'name': f'tag-{i}'} for i in range(total)]
+
+    def request(self, method: str, url: str, data=None, headers=None, params=None) -> Response:
+        """Return a page of tags for the provided params."""
+        # the next page url of a response carries the params in the query string
+        url_parts = urlsplit(url)
+        params = {**dict(parse_qsl(url_parts.query)), **(params or {})}
+        url = url_parts.path
+        with self.lock:
+            self.params.append(params)
+
+        result_limit = int(params.get('resultLimit', 100))
+        result_start = int(params.get('resultStart', 0))
+        if result_start == self.fail_start:
+            return self._response(method, url, {'status': 'Error'}, status_code=500)
+        if result_start == self.raise_start:
+            raise ValueError(f'request failed for resultStart={result_start}')
+
+        body = {'data': self.tags[result_start : result_start + result_limit], 'status': 'Success'}
+        if params.get('count') is True and self.return_count is True:
+            body['count'] = len(self.tags)
+        if result_start + result_limit < len(self.tags):
+            body[
+                'next'
+            ] = f'{url}?resultLimit={result_limit}&resultStart={result_start + result_limit}'
+        return self._response(method, url, body)
+
+    @staticmethod
+    def _response(method: str, url: str, body: dict, status_code: int = 200) -> Response:
+        """Return a requests Response for the provided body."""
+        request = PreparedRequest()
+        request.prepare(method=method, url=f'https://tc.local{url}')
+
+        response = Response()
+        response._content = json.dumps(body).encode()
+        response.headers['Content-Type'] = 'application/json'
+        response.request = request
+        response.status_code = status_code
+        response.url = request.url
+        return response
+
+
+# pylint: disable=no-self-use
+class TestObjectCollectionABC:
+    """Test the TcEx API V3 Collection Abstract Base Class."""
+
+    @pytest.mark.parametrize('prefetch_pages', [2, 3, 8])
+    def test_iterate_prefetch(self, prefetch_pages: int):
+        """Test that prefetched pages are returned in order and stop at the last page."""
+        session = MockSession(total=23)
+        tags = Tags(session=session, params={'result_limit': 5})
+        tags.prefetch_pages = prefetch_pages
+
+        assert [tag.model.id for tag in tags] == list(range(23))
+
+        # the first page requests the count, the remaining pages are requested once each
+        result_starts = sorted(int(p.get('resultStart', 0)) for p in session.params)
+        assert result_starts == [0, 5, 10, 15, 20]
+        assert session.params[0].get('count') is True
+
+    def test_iterate_prefetch_single_page(self):
+        """Test that no additional pages are requested when all results fit on a page."""
+        session = MockSession(total=3)
+        tags = Tags(session=session, params={'result_limit': 5})
+        tags.prefetch_pages = 4
+
+        assert [tag.model.id for tag in tags] == [0, 1, 2]
+        assert len(session.params) == 1
+
+    def test_iterate_prefetch_without_count(self):
+        """Test that the next url is followed when the first page has no count."""
+        session = MockSession(total=23, return_count=False)
+        tags = Tags(session=session, params={'result_limit': 5})
+        tags.prefetch_pages = 3
+
+        assert [tag.model.id for tag in tags] == list(range(23))
+        assert [int(p.get('resultStart', 0)) for p in session.params] == [0, 5, 10, 15, 20]
+
+    def test_iterate_prefetch_error(self):
+        """Test that an error response from a prefetched page is raised to the caller."""
+        session = MockSession(total=23, fail_start=10)
+        tags = Tags(session=session, params={'result_limit': 5})
+        tags.prefetch_pages = 3
+
+        ids = []
+        with pytest.raises(RuntimeError):
+            for tag in tags:
+                ids.append(tag.model.id)
+
+        # the pages before the failed page are returned
+        assert ids == list(range(10))
+
+    def test_iterate_prefetch_exception(self):
+        """Test that an exception raised in a worker thread is raised to the caller."""
+        session = MockSession(total=23, raise_start=15)
+        tags = Tags(session=session, params={'result_limit': 5})
+        tags.prefetch_pages = 3
+
+        with pytest.raises(ValueError, match='resultStart=15'):
+            list(tags)
+
+    def test_iterate_result_limit_default(self):
+        """Test that pages default to the collection result_limit."""
+        session = MockSession(total=1200)
+        tags = Tags(session=session)
+
+        assert [tag.model.id for tag in tags] == list(range(1200))
+        assert [int(p['resultLimit']) for p in session.params] == [500, 500, 500]
+
+    def test_iterate_result_limit_provided(self):
+        """Test that a provided result_limit is not replaced by the default."""
+        session = MockSession(total=12)
+        tags = Tags(session=session, params={'result_limit': 5})
+
+        assert [tag.model.id for tag in tags] == list(range(12))
+        assert [int(p['resultLimit']) for p in session.params] == [5, 5, 5]
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_decode_response(self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch):
+        """Test that the response body is decoded the same with and without orjson."""
+        if use_orjson is False:
+            monkeypatch.setattr('tcex.api.tc.v3.object_collection_abc.orjson', None)
+
+        body = {'data': [{'id': 1, 'name': 'tag-\u00e9'}], 'count': 1, 'status': 'Success'}
+        response = MockSession._response('GET', '/v3/tags', body)
+
+        assert ObjectCollectionABC._decode_response(response) == body
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_iterate_decode_response(self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch):
+        """Test that iteration returns the same objects with and without orjson."""
+        if use_orjson is False:
+            monkeypatch.setattr('tcex.api.tc.v3.object_collection_abc.orjson', None)
+
+        tags = Tags(session=MockSession(total=7), params={'result_limit': 5})
+        assert [tag.model.name for tag in tags] == [f'tag-{i}' for i in range(7)]
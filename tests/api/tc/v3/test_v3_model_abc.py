@@ -0,0 +1,117 @@
+"""Test the TcEx API V3 Base Model."""
+# standard library
+import json
+
+# first-party
+from tcex.api.tc.v3.groups.group import Group
+from tcex.api.tc.v3.groups.group_model import GroupModel
+from tcex.api.tc.v3.indicators.indicator_model import IndicatorModel
+from tcex.api.tc.v3.tags.tag_model import TagModel
+
+
+# pylint: disable=no-self-use
+class TestV3ModelABC:
+    """Test the TcEx API V3 Base Model."""
+
+    def test_lazy_model_serialization(self):
+        """Test that reading a lazy nested field does not change the model output."""
+        model = GroupModel(name='lazy')
+        before_dict = model.dict()
+        before_json = model.json(sort_keys=True)
+        assert before_dict['security_labels'] == {'data': [], 'mode': 'append'}
+
+        # read a lazy nested field
+        assert model.tags.data == []
+
+        assert model.dict() == before_dict
+        assert model.json(sort_keys=True) == before_json
+
+    def test_lazy_model_equality(self):
+        """Test that identical models are equal regardless of which lazy fields were read."""
+        model_1 = GroupModel(name='lazy')
+        model_2 = GroupModel(name='lazy')
+
+        # read a lazy nested field on only one of the models
+        assert model_1.security_labels.data == []
+
+        assert model_1 == model_2
+
+    def test_updated_field_assignment(self):
+        """Test that assigning a new field value marks the model as updated."""
+        model = GroupModel(id=1, name='updated')
+        assert model.updated is False
+
+        model.name = 'changed'
+        assert model.updated is True
+
+    def test_updated_same_value_assignment(self):
+        """Test that assigning the current field value does not mark the model as updated."""
+        model = GroupModel(id=1, name='updated')
+        model.name = 'updated'
+        assert model.updated is False
+
+    def test_updated_nested_append(self):
+        """Test that appending to a nested model marks the model as updated."""
+        model = GroupModel(id=1, name='updated')
+        model.tags.data.append(TagModel(name='staged'))
+        assert model.updated is True
+
+    def test_updated_nested_mutation(self):
+        """Test that changing an item of a nested model marks the model as updated."""
+        model = GroupModel(id=1, name='updated', tags={'data': [{'name': 'tag'}]})
+        assert model.updated is False
+
+        model.tags.data[0].name = 'changed'
+        assert model.updated is True
+
+    def test_updated_dict_mutation(self):
+        """Test that changing a dict field in place marks the model as updated."""
+        whois = {'domain': 'example.com'}
+        model = IndicatorModel(id=1, type='Host', host_name='example.com', whois=whois)
+        assert model.updated is False
+
+        model.whois['domain'] = 'changed.com'
+        assert model.updated is True
+
+    def test_updated_input_data_mutation(self):
+        """Test that changing the input data after creation does not hide model changes."""
+        data = {'id': 1, 'name': 'updated', 'tags': {'data': [{'name': 'tag'}]}}
+        model = GroupModel(**data)
+
+        data['name'] = 'changed'
+        data['tags']['data'][0]['name'] = 'changed'
+        assert model.updated is False
+
+        model.tags.data[0].name = 'changed'
+        assert model.updated is True
+        assert model.updated is True
+
+    def test_stage_security_label_trusted(self):
+        """Test that a trusted security label has the same output as a validated label."""
+        data = {
+            'color': 'ffc0cb',
+            'dateAdded': '2021-02-03T04:05:06Z',
+            'description': 'Security label description.',
+            'name': 'TLP:AMBER',
+            'owner': 'System',
+        }
+        group = Group(name='security-label', type='Adversary')
+        group.stage_security_label(data, trusted=True)
+        group.stage_security_label(data)
+        trusted, validated = group.model.security_labels.data
+
+        # the API field names are loaded into the model fields, not stored as extras
+        trusted_dict = trusted.dict()
+        assert list(trusted_dict) == list(validated.dict())
+        assert 'dateAdded' not in trusted_dict
+        assert trusted_dict['date_added'] == '2021-02-03T04:05:06Z'
+        assert trusted_dict['name'] == 'TLP:AMBER'
+
+        trusted_json = json.loads(trusted.json())
+        validated_json = json.loads(validated.json())
+        trusted_json.pop('date_added')
+        validated_json.pop('date_added')
+        assert trusted_json == validated_json
+
+        assert trusted._staged is True
+        assert trusted.gen_body_json('POST') == validated.gen_body_json('POST')
@@ -14,7 +14,8 @@ import redis
 
 # first-party
 from tcex.backports import cached_property
-from tcex.key_value_store import RedisClient
+from tcex.key_value_store import KeyValueRedis, RedisClient
+from tcex.playbook.playbook import Playbook
 from tcex.pleb.registry import registry
 from tcex.pleb.scoped_property import scoped_property
 from tests.mock_app import MockApp
@@ -22,7 +23,6 @@ from tests.mock_app import MockApp
 if TYPE_CHECKING:
     # first-party
     from tcex import TcEx
-    from tcex.playbook.playbook import Playbook
 
 logger = logging.getLogger('tcex')
 
@@ -112,6 +112,44 @@ def playbook_app() -> 'MockApp':
         _app.tcex.token.shutdown = True
 
 
+@pytest.fixture()
+def playbook_fakeredis(request, redis_client: redis.Redis) -> 'Playbook':
+    """Return an instance of Playbook using a fakeredis KV store, without creating a tcex.
+
+    The requested output variables are the tc_playbook_out_variables attribute of the test class.
+    """
+    return Playbook(
+        KeyValueRedis(redis_client),
+        'pytest-context',
+        list(request.cls.tc_playbook_out_variables),
+    )
+
+
+@pytest.fixture(scope='class')
+def playbook_tcex(request) -> 'TcEx':
+    """Return an instance of tcex for a playbook App shared by all tests in a class.
+
+    The App is configured with the tc_playbook_out_variables attribute of the test class.
+    """
+    temp_test_path = os.path.join(
+        request.fspath.dirname.replace(os.getcwd(), f'{os.getcwd()}/log'), request.cls.__name__
+    )
+    os.makedirs(os.path.join(temp_test_path, 'DEBUG'), exist_ok=True)
+
+    _reset_modules()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(temp_test_path)
+        app = MockApp(
+            runtime_level='Playbook',
+            config_data={'tc_playbook_out_variables': list(request.cls.tc_playbook_out_variables)},
+        )
+        _tcex = app.tcex
+
+    yield _tcex
+
+    _tcex.token.shutdown = True
+
+
 @pytest.fixture()
 def redis_client() -> redis.Redis:
     """Return instance of redis_client."""
@@ -40,13 +40,12 @@ class TestFailOnOutputDecorator:
         self.fail_msg = f'Failed due to invalid output {value}'
 
         # call decorated method and get result
-        try:
+        with pytest.raises(SystemExit) as e:
             self.fail_on_output(value=value)
-            assert False, f'failed to catch invalid value {value}'
-        except SystemExit as e:
-            assert e.code == 1
-            # must match default value in decorator or value passed to decorator
-            assert self.exit_message == self.fail_msg
+
+        assert e.value.code == 1
+        # must match default value in decorator or value passed to decorator
+        assert self.exit_message == self.fail_msg
 
     @pytest.mark.parametrize(
         'value',
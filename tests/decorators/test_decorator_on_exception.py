@@ -2,6 +2,9 @@
 # standard library
 import logging
 
+# third-party
+import pytest
+
 # first-party
 from tcex.decorators.on_exception import OnException
 
@@ -32,12 +35,11 @@ class TestOnExceptionDecorators:
         self.playbook = self.tcex.playbook
 
         # call method with decorator
-        try:
+        with pytest.raises(SystemExit) as e:
             self.on_exception()
-            assert False, 'exception not caught by decorator'
-        except SystemExit as e:
-            assert self.exit_message == 'on_exception method failed'
-            assert e.code == 1
+
+        assert self.exit_message == 'on_exception method failed'
+        assert e.value.code == 1
 
     @OnException(exit_msg='on_exception method no exit', exit_enabled='fail_on_error')
     def on_exception_exit_enabled_false(self):
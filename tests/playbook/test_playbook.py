@@ -5,288 +5,304 @@ from typing import TYPE_CHECKING, Any, List
 # third-party
 import pytest
 
+# first-party
+from tcex.key_value_store.key_value_abc import KeyValueABC
+from tcex.playbook.playbook import Playbook
+
 if TYPE_CHECKING:
     # first-party
     from tcex import TcEx
-    from tcex.playbook.playbook import Playbook
-    from tests.mock_app import MockApp
+
+TC_PLAYBOOK_OUT_VARIABLES = (
+    '#App:0001:b1!Binary',
+    '#App:0001:b2!Binary',
+    '#App:0001:b3!Binary',
+    '#App:0001:b4!Binary',
+    '#App:0001:ba1!BinaryArray',
+    '#App:0001:ba2!BinaryArray',
+    '#App:0001:ba3!BinaryArray',
+    '#App:0001:ba4!BinaryArray',
+    '#App:0001:kv1!KeyValue',
+    '#App:0001:kv2!KeyValue',
+    '#App:0001:kv3!KeyValue',
+    '#App:0001:kv4!KeyValue',
+    '#App:0001:kva1!KeyValueArray',
+    '#App:0001:kva2!KeyValueArray',
+    '#App:0001:kva3!KeyValueArray',
+    '#App:0001:kva4!KeyValueArray',
+    '#App:0001:s1!String',
+    '#App:0001:s2!String',
+    '#App:0001:s3!String',
+    '#App:0001:s4!String',
+    '#App:0001:sa1!StringArray',
+    '#App:0001:sa2!StringArray',
+    '#App:0001:sa3!StringArray',
+    '#App:0001:sa4!StringArray',
+    '#App:0001:te1!TCEntity',
+    '#App:0001:te2!TCEntity',
+    '#App:0001:te3!TCEntity',
+    '#App:0001:te4!TCEntity',
+    '#App:0001:tea1!TCEntityArray',
+    '#App:0001:tea2!TCEntityArray',
+    '#App:0001:tea3!TCEntityArray',
+    '#App:0001:tea4!TCEntityArray',
+    # '#App:0001:tee1!TCEnhanceEntity',
+    # '#App:0001:teea1!TCEnhanceEntityArray',
+    '#App:0001:r1!Raw',
+    '#App:0001:dup.name!String',
+    '#App:0001:dup.name!StringArray',
+)
+
+VARIABLE_DATA = (
+    ('#App:0001:b1!Binary', b'not really binary'),
+    ('#App:0001:ba1!BinaryArray', [b'not', b'really', b'binary']),
+    ('#App:0001:kv1!KeyValue', {'key': 'one', 'value': '1'}),
+    (
+        '#App:0001:kva1!KeyValueArray',
+        [{'key': 'one', 'value': '1'}, {'key': 'two', 'value': '2'}],
+    ),
+    ('#App:0001:s1!String', '1'),
+    ('#App:0001:s2!String', '2'),
+    ('#App:0001:s3!String', '3'),
+    ('#App:0001:s4!String', '4'),
+    ('#App:0001:sa1!StringArray', ['a', 'b', 'c']),
+    ('#App:0001:te1!TCEntity', {'id': '123', 'type': 'Address', 'value': '1.1.1.1'}),
+    (
+        '#App:0001:tea1!TCEntityArray',
+        [
+            {'id': '001', 'type': 'Address', 'value': '1.1.1.1'},
+            {'id': '002', 'type': 'Address', 'value': '2.2.2.2'},
+        ],
+    ),
+    ('#App:0001:r1!Raw', b'raw data'),
+    ('#App:0001:dup.name!String', 'dup name'),
+    ('#App:0001:dup.name!StringArray', ['dup name']),
+)
+
+
+class KeyValueSingleDelete(KeyValueABC):
+    """KV store that only supports deleting a single key per call."""
+
+    def __init__(self):
+        """Initialize the Class properties."""
+        self.deleted = []
+
+    def delete(self, context: str, key: str) -> Any:
+        """Record the deleted key."""
+        self.deleted.append((context, key))
+        return 1
 
 
 # pylint: disable=no-self-use
 class TestUtils:
     """Test the TcEx Batch Module."""
 
-    tc_playbook_out_variables = None
-
-    def setup_class(self):
-        """Configure setup before all tests."""
-        self.tc_playbook_out_variables = [
-            '#App:0001:b1!Binary',
-            '#App:0001:b2!Binary',
-            '#App:0001:b3!Binary',
-            '#App:0001:b4!Binary',
-            '#App:0001:ba1!BinaryArray',
-            '#App:0001:ba2!BinaryArray',
-            '#App:0001:ba3!BinaryArray',
-            '#App:0001:ba4!BinaryArray',
-            '#App:0001:kv1!KeyValue',
-            '#App:0001:kv2!KeyValue',
-            '#App:0001:kv3!KeyValue',
-            '#App:0001:kv4!KeyValue',
-            '#App:0001:kva1!KeyValueArray',
-            '#App:0001:kva2!KeyValueArray',
-            '#App:0001:kva3!KeyValueArray',
-            '#App:0001:kva4!KeyValueArray',
-            '#App:0001:s1!String',
-            '#App:0001:s2!String',
-            '#App:0001:s3!String',
-            '#App:0001:s4!String',
-            '#App:0001:sa1!StringArray',
-            '#App:0001:sa2!StringArray',
-            '#App:0001:sa3!StringArray',
-            '#App:0001:sa4!StringArray',
-            '#App:0001:te1!TCEntity',
-            '#App:0001:te2!TCEntity',
-            '#App:0001:te3!TCEntity',
-            '#App:0001:te4!TCEntity',
-            '#App:0001:tea1!TCEntityArray',
-            '#App:0001:tea2!TCEntityArray',
-            '#App:0001:tea3!TCEntityArray',
-            '#App:0001:tea4!TCEntityArray',
-            # '#App:0001:tee1!TCEnhanceEntity',
-            # '#App:0001:teea1!TCEnhanceEntityArray',
-            '#App:0001:r1!Raw',
-            '#App:0001:dup.name!String',
-            '#App:0001:dup.name!StringArray',
-        ]
+    tc_playbook_out_variables = TC_PLAYBOOK_OUT_VARIABLES
 
-    def test_playbook_check_key_requested(self, playbook_app: 'MockApp'):
+    def test_playbook_check_key_requested(self, playbook_tcex: 'TcEx'):
         """Test playbook variables."""
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        playbook: 'Playbook' = playbook_tcex.playbook
         assert playbook.check_key_requested('b1') is True
 
-    def test_playbook_check_variable_requested(self, playbook_app: 'MockApp'):
+    def test_playbook_check_variable_requested(self, playbook_tcex: 'TcEx'):
         """Test playbook variables."""
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        playbook: 'Playbook' = playbook_tcex.playbook
         assert playbook.check_variable_requested('#App:0001:b1!Binary') is True
 
     @pytest.mark.parametrize(
         'output_data',
-        [
-            (
-                [
-                    {'variable': '#App:0001:b1!Binary', 'value': b'bytes'},
-                    {
-                        'variable': '#App:0001:ba1!BinaryArray',
-                        'value': [b'not', b'really', b'binary'],
-                    },
-                    {'variable': '#App:0001:kv1!KeyValue', 'value': {'key': 'one', 'value': '1'}},
-                    {
-                        'variable': '#App:0001:kva1!KeyValueArray',
-                        'value': [{'key': 'one', 'value': '1'}, {'key': 'two', 'value': '2'}],
-                    },
-                    {'variable': '#App:0001:s1!String', 'value': '1'},
-                    {'variable': '#App:0001:sa1!StringArray', 'value': ['a', 'b', 'c']},
-                    {
-                        'variable': '#App:0001:te1!TCEntity',
-                        'value': {'id': '123', 'type': 'Address', 'value': '1.1.1.1'},
-                    },
-                    {
-                        'variable': '#App:0001:tea1!TCEntityArray',
-                        'value': [
-                            {'id': '001', 'type': 'Address', 'value': '1.1.1.1'},
-                            {'id': '002', 'type': 'Address', 'value': '2.2.2.2'},
-                        ],
-                    },
-                    {'variable': '#App:0001:r1!Raw', 'value': b'raw data'},
-                    {'variable': '#App:0001:n1!None', 'value': None},
-                ]
-            )
-        ],
+        (
+            [
+                {'variable': '#App:0001:b1!Binary', 'value': b'bytes'},
+                {
+                    'variable': '#App:0001:ba1!BinaryArray',
+                    'value': [b'not', b'really', b'binary'],
+                },
+                {'variable': '#App:0001:kv1!KeyValue', 'value': {'key': 'one', 'value': '1'}},
+                {
+                    'variable': '#App:0001:kva1!KeyValueArray',
+                    'value': [{'key': 'one', 'value': '1'}, {'key': 'two', 'value': '2'}],
+                },
+                {'variable': '#App:0001:s1!String', 'value': '1'},
+                {'variable': '#App:0001:sa1!StringArray', 'value': ['a', 'b', 'c']},
+                {
+                    'variable': '#App:0001:te1!TCEntity',
+                    'value': {'id': '123', 'type': 'Address', 'value': '1.1.1.1'},
+                },
+                {
+                    'variable': '#App:0001:tea1!TCEntityArray',
+                    'value': [
+                        {'id': '001', 'type': 'Address', 'value': '1.1.1.1'},
+                        {'id': '002', 'type': 'Address', 'value': '2.2.2.2'},
+                    ],
+                },
+                {'variable': '#App:0001:r1!Raw', 'value': b'raw data'},
+                {'variable': '#App:0001:n1!None', 'value': None},
+            ],
+        ),
     )
-    def test_playbook_output_add_all(self, output_data: List[dict], playbook_app: 'MockApp'):
+    def test_playbook_output_add_all(self, output_data: List[dict], playbook_tcex: 'TcEx'):
         """Test playbook variables."""
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        playbook: 'Playbook' = playbook_tcex.playbook
+
+        # the None type variable is not requested by the App and is validated separately
+        sentinels = [od['variable'] for od in output_data if od['value'] is None]
+        real_outputs = [od for od in output_data if od['value'] is not None]
 
         # add all output
         expected_data = {}
-        for od in output_data:
-            variable = od.get('variable')
-            value = od.get('value')
+        for od in real_outputs:
+            variable = od['variable']
+            value = od['value']
 
-            variable_model = tcex.utils.get_playbook_variable_model(variable)
-            playbook.output[variable_model.key] = value
+            _, _, key, _ = playbook.utils.get_playbook_variable(variable)
+            playbook.output[key] = value
 
-            if variable in expected_data:
-                if isinstance(value, list):
-                    expected_data[variable].extend(value)
-                else:
-                    expected_data[variable].append(value)
-            else:
-                expected_data.setdefault(variable, value)
+            expected_data.setdefault(variable, []).extend(
+                value if isinstance(value, list) else [value]
+            )
 
         # write output
         playbook.output.process()
 
-        # validate output
-        for variable, value in expected_data.items():
-            result = playbook.read.variable(variable)
+        # non-array types are read as a single value
+        expected_data = {
+            variable: v[0] if len(v) == 1 and not variable.endswith('Array') else v
+            for variable, v in expected_data.items()
+        }
 
-            assert result == value, f'result of ({result}) does not match ({value})'
+        # validate output
+        results = {variable: playbook.read.variable(variable) for variable in expected_data}
+        assert results == expected_data, f'results of ({results}) do not match ({expected_data})'
 
-            playbook.delete.variable(variable)
+        # validate sentinel output was not written
+        for variable in sentinels:
             assert playbook.read.variable(variable) is None
 
-    @pytest.mark.parametrize(
-        'variable,value',
-        [
-            ('#App:0001:b1!Binary', b'not really binary'),
-            ('#App:0001:ba1!BinaryArray', [b'not', b'really', b'binary']),
-            ('#App:0001:kv1!KeyValue', {'key': 'one', 'value': '1'}),
-            (
-                '#App:0001:kva1!KeyValueArray',
-                [{'key': 'one', 'value': '1'}, {'key': 'two', 'value': '2'}],
-            ),
-            ('#App:0001:s1!String', '1'),
-            ('#App:0001:s2!String', '2'),
-            ('#App:0001:s3!String', '3'),
-            ('#App:0001:s4!String', '4'),
-            ('#App:0001:sa1!StringArray', ['a', 'b', 'c']),
-            ('#App:0001:te1!TCEntity', {'id': '123', 'type': 'Address', 'value': '1.1.1.1'}),
-            (
-                '#App:0001:tea1!TCEntityArray',
-                [
-                    {'id': '001', 'type': 'Address', 'value': '1.1.1.1'},
-                    {'id': '002', 'type': 'Address', 'value': '2.2.2.2'},
-                ],
-            ),
-            ('#App:0001:r1!Raw', b'raw data'),
-            ('#App:0001:dup.name!String', 'dup name'),
-            ('#App:0001:dup.name!StringArray', ['dup name']),
-        ],
-    )
-    def test_playbook_create_variable(self, variable: str, value: Any, playbook_app: 'MockApp'):
+        # cleanup
+        playbook.delete.variables(expected_data)
+
+    @pytest.mark.parametrize('variable,value', VARIABLE_DATA)
+    def test_playbook_create_variable(self, variable: str, value: Any, playbook_tcex: 'TcEx'):
         """Test playbook variables."""
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        playbook: 'Playbook' = playbook_tcex.playbook
 
         # parse variable and send to output.variable() method
-        variable_model = tcex.utils.get_playbook_variable_model(variable)
-        playbook.create.variable(variable_model.key, value, variable_model.type)
+        _, _, key, type_ = playbook.utils.get_playbook_variable(variable)
+        playbook.create.variable(key, value, type_)
         result = playbook.read.variable(variable)
         assert result == value, f'result of ({result}) does not match ({value})'
 
         playbook.delete.variable(variable)
-        assert playbook.read.variable(variable) is None
 
     @pytest.mark.parametrize(
         'variable,value',
-        [
-            ('#App:0001:b1!Binary', b'not really binary'),
-            ('#App:0001:ba1!BinaryArray', [b'not', b'really', b'binary']),
-            ('#App:0001:kv1!KeyValue', {'key': 'one', 'value': '1'}),
-            (
-                '#App:0001:kva1!KeyValueArray',
-                [{'key': 'one', 'value': '1'}, {'key': 'two', 'value': '2'}],
-            ),
-            ('#App:0001:s1!String', '1'),
-            ('#App:0001:s2!String', '2'),
-            ('#App:0001:s3!String', '3'),
-            ('#App:0001:s4!String', '4'),
-            ('#App:0001:sa1!StringArray', ['a', 'b', 'c']),
-            ('#App:0001:te1!TCEntity', {'id': '123', 'type': 'Address', 'value': '1.1.1.1'}),
-            (
-                '#App:0001:tea1!TCEntityArray',
-                [
-                    {'id': '001', 'type': 'Address', 'value': '1.1.1.1'},
-                    {'id': '002', 'type': 'Address', 'value': '2.2.2.2'},
-                ],
-            ),
-            ('#App:0001:r1!Raw', b'raw data'),
-        ],
+        tuple(vd for vd in VARIABLE_DATA if not vd[0].startswith('#App:0001:dup.name!')),
     )
     def test_playbook_output_variable_without_type(
-        self, variable: str, value: Any, playbook_app: 'MockApp'
+        self, variable: str, value: Any, playbook_tcex: 'TcEx'
     ):
         """Test playbook variables."""
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        playbook: 'Playbook' = playbook_tcex.playbook
 
         # parse variable and send to output.variable() method
-        variable_model = tcex.utils.get_playbook_variable_model(variable)
+        _, _, key, _ = playbook.utils.get_playbook_variable(variable)
 
-        playbook.create.variable(variable_model.key, value)
+        playbook.create.variable(key, value)
         result = playbook.read.variable(variable)
         assert result == value, f'result of ({result}) does not match ({value})'
 
         playbook.delete.variable(variable)
-        assert playbook.read.variable(variable) is None
 
     @pytest.mark.parametrize(
         'variable,value',
-        [
+        (
+            ('#App:0001:s1!String', '1'),
+            ('#App:0001:sa1!StringArray', ['a', 'b', 'c']),
+        ),
+    )
+    def test_playbook_delete_variable(self, variable: str, value: Any, playbook_tcex: 'TcEx'):
+        """Test playbook variables."""
+        playbook: 'Playbook' = playbook_tcex.playbook
+
+        _, _, key, type_ = playbook.utils.get_playbook_variable(variable)
+        playbook.create.variable(key, value, type_)
+        assert playbook.read.variable(variable) == value
+
+        playbook.delete.variable(variable)
+        result = playbook.read.variable(variable)
+        assert result is None, f'result of ({result}) should be None'
+
+    def test_playbook_delete_variables(self, playbook_fakeredis: 'Playbook'):
+        """Test deleting multiple variables in a single call."""
+        playbook: 'Playbook' = playbook_fakeredis
+        playbook.create.variable('s1', '1')
+        playbook.create.variable('s2', '2')
+        playbook.create.variable('sa1', ['a', 'b', 'c'])
+
+        assert playbook.delete.variables(['#App:0001:s1!String', ' #App:0001:sa1!StringArray']) == 2
+        assert playbook.read.variable('#App:0001:s1!String') is None
+        assert playbook.read.variable('#App:0001:sa1!StringArray') is None
+        assert playbook.read.variable('#App:0001:s2!String') == '2'
+
+    def test_playbook_delete_variables_default(self):
+        """Test deleting multiple variables with a KV store without delete_many support."""
+        key_value_store = KeyValueSingleDelete()
+        playbook = Playbook(key_value_store, 'pytest-context', list(TC_PLAYBOOK_OUT_VARIABLES))
+
+        assert playbook.delete.variables(['#App:0001:s1!String', '#App:0001:s2!String']) == [1, 1]
+        assert key_value_store.deleted == [
+            ('pytest-context', '#App:0001:s1!String'),
+            ('pytest-context', '#App:0001:s2!String'),
+        ]
+
+    @pytest.mark.parametrize(
+        'variable,value',
+        (
             ('#App:0001:not_requested!String', 'not requested'),
             ('#App:0001:none!String', 'None'),
             ('#App:0001:dup.name!String', None),
             ('#App:0001:dup.name!StringArray', None),
-        ],
+        ),
     )
     def test_playbook_output_variable_not_written(
-        self, variable: str, value: Any, playbook_app: 'MockApp'
+        self, variable: str, value: Any, playbook_fakeredis: 'Playbook'
     ):
         """Test playbook variables."""
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        playbook: 'Playbook' = playbook_fakeredis
 
         # parse variable and send to output.variable() method
-        variable_model = tcex.utils.get_playbook_variable_model(variable)
-        playbook.create.variable(variable_model.key, value, variable_model.type)
+        _, _, key, type_ = playbook.utils.get_playbook_variable(variable)
+        playbook.create.variable(key, value, type_)
 
         result = playbook.read.variable(variable)
         assert result is None, f'result of ({result}) should be None'
 
     @pytest.mark.parametrize(
         'variable,value',
-        [
+        (
             ('#App:0001:not_requested!String', 'not requested'),
             ('#App:0001:none!String', None),
             (None, None),  # coverage
-        ],
+        ),
     )
-    def test_playbook_output_variable_not_written_without_type(self, variable, value, playbook_app):
+    def test_playbook_output_variable_not_written_without_type(
+        self, variable, value, playbook_fakeredis
+    ):
         """Test the create output method of Playbook module.
 
         Args:
             variable (str): The key/variable to create in Key Value Store.
             value (str): The value to store in Key Value Store.
-            playbook_app (callable, fixture): The playbook_app fixture.
+            playbook_fakeredis (Playbook, fixture): The playbook_fakeredis fixture.
         """
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        playbook: 'Playbook' = playbook_fakeredis
 
         # parse variable and send to output.variable() method
-        variable_model = tcex.utils.get_playbook_variable_model(variable)
-        variable_key = None  # coverage
+        key = None  # coverage
         if variable is not None:
-            variable_key = variable_model.key
-        playbook.create.variable(variable_key, value)
+            _, _, key, _ = playbook.utils.get_playbook_variable(variable)
+        playbook.create.variable(key, value)
 
         result = playbook.read.variable(variable)
         assert result is None, f'result of ({result}) should be None'
@@ -318,45 +334,33 @@ class TestUtils:
     #     assert playbook.read.variable(variable) is None
 
     @pytest.mark.parametrize(
-        'variable,value',
-        [('#App:0001:s1!String', '1')],
+        'variable,value,expected',
+        (
+            ('#App:0001:s1!String', '1', ['1']),
+            ('#App:0001:none!String', None, []),
+        ),
     )
-    def test_playbook_read(self, variable, value, playbook_app):
-        """Test the create output method of Playbook module.
+    def test_playbook_read_as_array(self, variable, value, expected, playbook_tcex):
+        """Test the read variable method of Playbook module with array enabled.
 
         Args:
             variable (str): The key/variable to create in Key Value Store.
-            value (str): The value to store in Key Value Store.
-            playbook_app (callable, fixture): The playbook_app fixture.
+            value (str): The value to store in Key Value Store, None to skip the create.
+            expected (list): The expected result of the read.
+            playbook_tcex (TcEx, fixture): The playbook_tcex fixture.
         """
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        playbook: 'Playbook' = playbook_tcex.playbook
 
         # parse variable and send to output.variable() method
-        variable_model = tcex.utils.get_playbook_variable_model(variable)
-        playbook.create.variable(variable_model.key, value, variable_model.type)
-        result = playbook.read.variable(variable, True)
-        assert result == [value], f'result of ({result}) does not match ({value})'
-
-        playbook.delete.variable(variable)
-        assert playbook.read.variable(variable) is None
+        if value is not None:
+            _, _, key, type_ = playbook.utils.get_playbook_variable(variable)
+            playbook.create.variable(key, value, type_)
 
-    def test_playbook_read_none_array(self, playbook_app):
-        """Test the create output method of Playbook module.
-
-        Args:
-            playbook_app (callable, fixture): The playbook_app fixture.
-        """
-        tcex: 'TcEx' = playbook_app(
-            config_data={'tc_playbook_out_variables': self.tc_playbook_out_variables}
-        ).tcex
-        playbook: 'Playbook' = tcex.playbook
+        result = playbook.read.variable(variable, True)
+        assert result == expected, f'result of ({result}) does not match ({expected})'
 
-        # parse variable and send to output.variable() method
-        result = playbook.read.variable('#App:0001:none!String', True)
-        assert result == [], f'result of ({result}) does not match ([])'
+        if value is not None:
+            playbook.delete.variable(variable)
 
     # @pytest.mark.parametrize(
     #     'variable,value,alt_variable,alt_value,expected',
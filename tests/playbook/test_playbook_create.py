@@ -1,5 +1,6 @@
 """Tests for TcEx Playbook Create Module."""
 # standard library
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 # third-party
@@ -8,6 +9,7 @@ import pytest
 # first-party
 from tcex.backports import cached_property
 from tcex.input.field_types import KeyValue
+from tcex.key_value_store.key_value_abc import KeyValueABC
 from tcex.pleb.scoped_property import scoped_property
 
 if TYPE_CHECKING:
@@ -827,3 +829,98 @@ class TestPlaybookCreate:
                 playbook.create.tc_entity_array(key, value, validate, when_requested)
 
             assert 'Invalid' in str(ex.value)
+
+    def test_playbook_create_output_process(self, monkeypatch, playbook_fakeredis: 'Playbook'):
+        """Test that all output is created in a single KV store call."""
+        playbook: 'Playbook' = playbook_fakeredis
+        key_value_store = playbook.key_value_store
+
+        calls = []
+        create_many = key_value_store.create_many
+
+        def mock_create_many(context, data):
+            calls.append(data)
+            return create_many(context, data)
+
+        monkeypatch.setattr(key_value_store, 'create_many', mock_create_many)
+
+        playbook.output['b1'] = b'bytes'
+        playbook.output['kv1'] = {'key': 'one', 'value': '1'}
+        playbook.output['s1'] = '1'
+        playbook.output['sa1'] = ['a', 'b', 'c']
+        playbook.output['not_requested'] = 'not requested'
+        playbook.output.process()
+
+        assert len(calls) == 1
+        assert sorted(calls[0]) == [
+            '#App:0001:b1!Binary',
+            '#App:0001:kv1!KeyValue',
+            '#App:0001:s1!String',
+            '#App:0001:sa1!StringArray',
+        ]
+        assert playbook.read.variable('#App:0001:b1!Binary') == b'bytes'
+        assert playbook.read.variable('#App:0001:kv1!KeyValue') == {'key': 'one', 'value': '1'}
+        assert playbook.read.variable('#App:0001:s1!String') == '1'
+        assert playbook.read.variable('#App:0001:sa1!StringArray') == ['a', 'b', 'c']
+
+    def test_playbook_create_deferred_exception(self, playbook_fakeredis: 'Playbook'):
+        """Test that deferred data is discarded when an exception is raised in the context."""
+        playbook: 'Playbook' = playbook_fakeredis
+
+        with pytest.raises(RuntimeError, match='error'):
+            with playbook.create.deferred():
+                playbook.create.variable('s1', '1')
+                raise RuntimeError('error')
+
+        assert playbook.read.variable('#App:0001:s1!String') is None
+
+    def test_playbook_create_deferred_return(self, playbook_fakeredis: 'Playbook'):
+        """Test that create methods return None inside the deferred context."""
+        playbook: 'Playbook' = playbook_fakeredis
+
+        with playbook.create.deferred():
+            assert playbook.create.variable('s1', '1') is None
+            assert playbook.read.variable('#App:0001:s1!String') is None
+
+        assert playbook.read.variable('#App:0001:s1!String') == '1'
+
+    def test_playbook_create_deferred_write_error(
+        self, monkeypatch, playbook_fakeredis: 'Playbook'
+    ):
+        """Test that a failed write for one key does not stop the remaining writes."""
+        playbook: 'Playbook' = playbook_fakeredis
+        key_value_store = playbook.key_value_store
+        create = key_value_store.create
+
+        def mock_create(context, key, value):
+            if key == '#App:0001:s1!String':
+                raise RuntimeError('write failed')
+            return create(context, key, value)
+
+        # use the KeyValueABC create_many, which creates each key individually
+        monkeypatch.setattr(key_value_store, 'create', mock_create)
+        monkeypatch.setattr(
+            key_value_store, 'create_many', partial(KeyValueABC.create_many, key_value_store)
+        )
+
+        playbook.output['b1'] = b'bytes'
+        playbook.output['s1'] = '1'
+        playbook.output['sa1'] = ['a', 'b', 'c']
+        playbook.output.process()
+
+        assert playbook.read.variable('#App:0001:b1!Binary') == b'bytes'
+        assert playbook.read.variable('#App:0001:s1!String') is None
+        assert playbook.read.variable('#App:0001:sa1!StringArray') == ['a', 'b', 'c']
+
+    def test_playbook_create_many_redis_error(self, playbook_fakeredis: 'Playbook'):
+        """Test that a Redis error for one key does not stop the remaining writes."""
+        playbook: 'Playbook' = playbook_fakeredis
+        redis_client = playbook.key_value_store.redis_client
+
+        # a hset on a key holding a string fails with a WRONGTYPE error
+        redis_client.set('pytest-context-string', 'string')
+        results = playbook.key_value_store.create_many('pytest-context-string', {'s1': '1'})
+        assert results == [None]
+
+        results = playbook.key_value_store.create_many('pytest-context', {'s1': '1', 's2': '2'})
+        assert results == [1, 1]
@@ -1,14 +1,17 @@
 """Test the TcEx Batch Module."""
 # standard library
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Union
 
 # third-party
 import pytest
 
+# first-party
+from tcex.playbook.playbook import Playbook
+from tcex.playbook.playbook_read import PlaybookRead
+
 if TYPE_CHECKING:
     # first-party
     from tcex import TcEx
-    from tcex.playbook.playbook import Playbook
     from tests.mock_app import MockApp
 
 
@@ -86,3 +89,145 @@ class TestUtils:
     def test_playbook_read_decode_binary(self, data: bytes, expected: str, playbook: 'Playbook'):
         """Test playbook variables."""
         assert playbook.read._decode_binary(data) == expected
+
+    @pytest.mark.parametrize(
+        'value,expected',
+        [
+            ('{"key": "one", "value": "1"}', {'key': 'one', 'value': '1'}),
+            ('["a", "b", "c"]', ['a', 'b', 'c']),
+            ('"string"', 'string'),
+            ('{"value": Infinity}', {'value': float('inf')}),
+        ],
+    )
+    def test_playbook_read_load_data(self, value: str, expected: Any):
+        """Test playbook variables."""
+        result = PlaybookRead._load_data(value)
+        assert result == expected
+        assert type(result) is type(expected)  # pylint: disable=unidiomatic-typecheck
+
+    @pytest.mark.parametrize(
+        'value,expected',
+        [
+            ('{"key": "one", "value": "1"}', {'key': 'one', 'value': '1'}),
+            ('["a", "b", "c"]', ['a', 'b', 'c']),
+            ('"string"', 'string'),
+        ],
+    )
+    def test_playbook_read_load_data_without_orjson(
+        self, value: str, expected: Any, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test playbook variables."""
+        monkeypatch.setattr('tcex.playbook.playbook_read.orjson', None)
+        result = PlaybookRead._load_data(value)
+        assert result == expected
+        assert type(result) is type(expected)  # pylint: disable=unidiomatic-typecheck
+
+    def test_playbook_read_load_data_invalid(self):
+        """Test playbook variables."""
+        with pytest.raises(RuntimeError):
+            PlaybookRead._load_data('not json')
+
+    def test_playbook_read_load_data_invalid_without_orjson(self, monkeypatch: pytest.MonkeyPatch):
+        """Test playbook variables."""
+        monkeypatch.setattr('tcex.playbook.playbook_read.orjson', None)
+        with pytest.raises(RuntimeError):
+            PlaybookRead._load_data('not json')
+
+    @staticmethod
+    def _track_reads(monkeypatch, playbook: 'Playbook') -> list:
+        """Return the list of keys read from the KV store by the playbook."""
+        reads = []
+        read = playbook.key_value_store.read
+
+        def mock_read(context, key):
+            reads.append(key)
+            return read(context, key)
+
+        monkeypatch.setattr(playbook.key_value_store, 'read', mock_read)
+        return reads
+
+    def test_playbook_read_cache(self, monkeypatch, playbook_fakeredis: 'Playbook'):
+        """Test that input data is read once and invalidated on delete."""
+        playbook: 'Playbook' = playbook_fakeredis
+        reads = self._track_reads(monkeypatch, playbook)
+        variable = '#App:0002:in1!String'
+
+        # data written by an upstream App
+        playbook.key_value_store.create(playbook.context, variable, '"1"')
+        assert playbook.read.variable(variable) == '1'
+        assert playbook.read.variable(variable) == '1'
+        assert reads == [variable]
+
+        # delete invalidates the cached data
+        playbook.delete.variable(variable)
+        assert playbook.read.variable(variable) is None
+        assert reads == [variable, variable]
+
+    def test_playbook_read_cache_miss(self, monkeypatch, playbook_fakeredis: 'Playbook'):
+        """Test that missing data is not cached."""
+        playbook: 'Playbook' = playbook_fakeredis
+        reads = self._track_reads(monkeypatch, playbook)
+        variable = '#App:0002:in1!String'
+
+        assert playbook.read.variable(variable) is None
+
+        playbook.key_value_store.create(playbook.context, variable, '"1"')
+        assert playbook.read.variable(variable) == '1'
+        assert reads == [variable, variable]
+
+    def test_playbook_read_cache_output_variable(self, playbook_fakeredis: 'Playbook'):
+        """Test that data written through a second instance is read by the first instance."""
+        playbook_1: 'Playbook' = playbook_fakeredis
+        playbook_2 = Playbook(
+            playbook_1.key_value_store, playbook_1.context, playbook_1.output_variables
+        )
+        variable = '#App:0001:s1!String'
+
+        playbook_1.create.variable('s1', '1')
+        assert playbook_1.read.variable(variable) == '1'
+
+        playbook_2.create.variable('s1', '2')
+        assert playbook_1.read.variable(variable) == '2'
+
+        playbook_2.output['s1'] = '3'
+        playbook_2.output.process()
+        assert playbook_1.read.variable(variable) == '3'
+
+    def test_playbook_read_cache_size(self, playbook_fakeredis: 'Playbook'):
+        """Test that the read cache is bounded."""
+        playbook = Playbook(
+            playbook_fakeredis.key_value_store,
+            playbook_fakeredis.context,
+            playbook_fakeredis.output_variables,
+            read_cache_size=2,
+        )
+
+        variables = [f'#App:0002:in{i}!String' for i in range(3)]
+        for variable in variables:
+            playbook.key_value_store.create(playbook.context, variable, '"1"')
+            assert playbook.read.variable(variable) == '1'
+
+        # the oldest entry is evicted
+        assert list(playbook._read_cache) == variables[1:]  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize('read_cache_size,expected', ((512, '1'), (0, '2')))
+    def test_playbook_read_cache_outside_write(
+        self, read_cache_size: int, expected: str, monkeypatch, playbook_fakeredis: 'Playbook'
+    ):
+        """Test that a write made outside of the Playbook instance is only read without cache."""
+        playbook = Playbook(
+            playbook_fakeredis.key_value_store,
+            playbook_fakeredis.context,
+            playbook_fakeredis.output_variables,
+            read_cache_size=read_cache_size,
+        )
+        reads = self._track_reads(monkeypatch, playbook)
+        variable = '#App:0002:in1!String'
+
+        playbook.key_value_store.create(playbook.context, variable, '"1"')
+        assert playbook.read.variable(variable) == '1'
+
+        # a write made by another KV store client is not seen while the value is cached
+        playbook.key_value_store.redis_client.hset(playbook.context, variable, '"2"')
+        assert playbook.read.variable(variable) == expected
+        assert len(reads) == (1 if read_cache_size else 2)
@@ -6,7 +6,7 @@ import re
 import pytest
 
 # first-party
-from tcex.utils.variables import Variables
+from tcex.utils.variables import PlaybookVariable, Variables, _get_playbook_variable_model
 
 variables = Variables()
 
@@ -33,6 +33,44 @@ class TestVariables:
         results = variables.get_playbook_variable_model(variable)
         assert results.dict() == expected
 
+    def test_variable_to_method_cached(self):
+        """Test Module"""
+        variable = '#App:0001:cached!String'
+        cache_info = _get_playbook_variable_model.cache_info()
+
+        # the cache is shared by all Variables instances
+        results = [Variables().get_playbook_variable_model(variable) for _ in range(3)]
+        assert _get_playbook_variable_model.cache_info().misses == cache_info.misses + 1
+        assert _get_playbook_variable_model.cache_info().hits == cache_info.hits + 2
+
+        # each call returns a copy, modifying one result does not change the others
+        assert results[0] == results[1] and results[0] is not results[1]
+        results[0].key = 'modified'
+        assert results[1].key == 'cached'
+        assert variables.get_playbook_variable_model(variable).key == 'cached'
+
+        assert variables.get_playbook_variable_model(None) is None
+
+    def test_get_playbook_variable(self):
+        """Test Module"""
+        variable = '#App:0001:parsed.key!StringArray'
+        parsed_variable = variables.get_playbook_variable(variable)
+        assert isinstance(parsed_variable, PlaybookVariable)
+
+        app_type, job_id, key, type_ = parsed_variable
+        assert (app_type, job_id, key, type_) == ('App', '0001', 'parsed.key', 'StringArray')
+        assert parsed_variable._asdict() == variables.get_playbook_variable_model(variable).dict()
+
+        # the parsed variable is immutable, so the cached value is returned
+        assert Variables().get_playbook_variable(variable) is parsed_variable
+        with pytest.raises(AttributeError):
+            parsed_variable.key = 'modified'  # pylint: disable=assigning-non-slot
+
+        assert variables.get_playbook_variable(None) is None
+        assert variables.get_playbook_variable('-- Select --') is None
+        assert variables.get_playbook_variable_type('-- Select --') == 'String'
+        assert variables.get_playbook_variable_type(variable) == 'StringArray'
+
     @pytest.mark.parametrize(
         'variable,expected',
         [